@@ -2,10 +2,13 @@
 Core structural calculations for cantilever slide gates
 """
 
-from typing import Dict
-from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
 
-from utils.engineering_constants import GRAVITY_MS2
+import numpy as np
+
+from utils.engineering_constants import GRAVITY_MS2, N_TO_KG, PA_TO_MPA
 from utils.material_properties import SteelProperties
 
 
@@ -21,7 +24,7 @@ class LoadCase:
     load_factor: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class GateGeometry:
     """Gate geometry parameters"""
 
@@ -32,9 +35,312 @@ class GateGeometry:
     counterweight_length_mm: float
     frame_depth_mm: float
 
+    @cached_property
+    def perimeter_mm(self) -> float:
+        """Frame perimeter (length of the outer frame members)"""
+        return 2 * (self.width_mm + self.height_mm)
+
+
+# Structured record layout for storing batches of gate geometries
+GEOM_DTYPE = np.dtype(
+    [
+        ("width_mm", "f8"),
+        ("height_mm", "f8"),
+        ("cantilever_length_mm", "f8"),
+        ("track_length_mm", "f8"),
+        ("counterweight_length_mm", "f8"),
+        ("frame_depth_mm", "f8"),
+    ]
+)
+
+
+@dataclass
+class GateGeometryArray:
+    """Gate geometry parameters for a batch of designs (one array per field)"""
+
+    width_mm: np.ndarray
+    height_mm: np.ndarray
+    cantilever_length_mm: np.ndarray
+    track_length_mm: np.ndarray
+    counterweight_length_mm: np.ndarray
+    frame_depth_mm: np.ndarray
+
+    def __post_init__(self):
+        """Coerce every field to a float64 array of a common shape"""
+        names = [f.name for f in fields(self)]
+        arrays = np.broadcast_arrays(
+            *(np.asarray(getattr(self, name), dtype=np.float64) for name in names)
+        )
+        for name, array in zip(names, arrays):
+            setattr(self, name, array)
+
+    def __len__(self) -> int:
+        return self.width_mm.size
+
+    def __getitem__(self, index) -> GateGeometry:
+        """Single design of the batch as a GateGeometry"""
+        return GateGeometry(
+            **{
+                name: float(getattr(self, name).flat[index])
+                for name in GEOM_DTYPE.names
+            }
+        )
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "GateGeometryArray":
+        """View the fields of a GEOM_DTYPE structured array as a batch"""
+        return cls(**{name: records[name] for name in GEOM_DTYPE.names})
+
+    def to_records(self) -> np.ndarray:
+        """Pack the batch into a GEOM_DTYPE structured array"""
+        records = np.empty(self.width_mm.shape, dtype=GEOM_DTYPE)
+        for name in GEOM_DTYPE.names:
+            records[name] = getattr(self, name)
+        return records
+
+    @classmethod
+    def from_geometries(cls, geometries: Iterable[GateGeometry]) -> "GateGeometryArray":
+        """Stack individual gate geometries into a batch"""
+        geometries = list(geometries)
+        return cls(
+            **{
+                f.name: np.array([getattr(g, f.name) for g in geometries])
+                for f in fields(GateGeometry)
+            }
+        )
+
+
+# Geometry and numeric inputs accepted by the calculation methods. Scalar
+# inputs produce float results; array inputs produce elementwise array results.
+Geometry = GateGeometry | GateGeometryArray
+FloatArray = float | np.ndarray
+
+
+# Wind pressure constant for standard air (ASCE 7-16) and drag coefficient for
+# a rectangular gate
+WIND_PRESSURE_COEFFICIENT = 0.613
+WIND_DRAG_COEFFICIENT = 1.2
+
+
+# Calculation kernels: the arithmetic of each CantileverCalculations method as
+# a free function of primitive arguments, callable from hot loops without
+# dataclass attribute lookups. They accept floats and NumPy arrays alike.
+
+
+def gate_weight_kernel(
+    width_mm: FloatArray,
+    height_mm: FloatArray,
+    frame_section_area_mm2: FloatArray,
+    density_kg_m3: FloatArray,
+    infill_weight_kg_m2: FloatArray,
+) -> FloatArray:
+    """Total gate weight (N) from frame steel plus infill"""
+    # Frame weight calculation
+    frame_perimeter_mm = 2 * (width_mm + height_mm)
+    frame_volume_mm3 = frame_perimeter_mm * frame_section_area_mm2
+    frame_weight_kg = frame_volume_mm3 * density_kg_m3 / 1e9
+
+    # Infill weight calculation
+    infill_area_m2 = (width_mm * height_mm) / 1e6
+    infill_weight_kg = infill_area_m2 * infill_weight_kg_m2
+
+    # Total weight in Newtons
+    return (frame_weight_kg + infill_weight_kg) * GRAVITY_MS2
+
+
+def wind_factor_kernel(wind_speed_ms: FloatArray) -> FloatArray:
+    """Wind load per unit gate face area (N/mm²) for a design wind speed"""
+    return (
+        WIND_PRESSURE_COEFFICIENT
+        * (wind_speed_ms * wind_speed_ms)
+        * WIND_DRAG_COEFFICIENT
+        * PA_TO_MPA  # Pa -> N/mm²
+    )
+
+
+def wind_load_kernel(
+    width_mm: FloatArray, height_mm: FloatArray, wind_speed_ms: FloatArray
+) -> FloatArray:
+    """Wind load (N) on the gate face per ASCE 7-16"""
+    # Dynamic pressure, drag coefficient and mm² -> m² conversion folded into
+    # one factor that is independent of the gate geometry
+    wind_factor = wind_factor_kernel(wind_speed_ms)
+
+    return wind_factor * width_mm * height_mm
+
+
+class WindLoadEvaluator:
+    """
+    Wind load on gate faces for one fixed design wind speed
+
+    The dynamic pressure, drag coefficient and mm² -> m² conversion do not
+    depend on geometry, so they are folded into a single factor once and each
+    evaluation is a plain product. Works elementwise on arrays of widths and
+    heights for parameter sweeps.
+    """
+
+    def __init__(self, wind_speed_ms: FloatArray = 33.5):
+        self.wind_speed_ms = wind_speed_ms
+        self._factor = wind_factor_kernel(wind_speed_ms)
+
+    def __call__(self, width_mm: FloatArray, height_mm: FloatArray) -> FloatArray:
+        """Wind load in Newtons for the given gate face dimensions"""
+        return self._factor * width_mm * height_mm
+
+
+@lru_cache(maxsize=64)
+def _wind_evaluator_for(wind_speed_ms: float) -> WindLoadEvaluator:
+    """Shared WindLoadEvaluator for one scalar design wind speed"""
+    return WindLoadEvaluator(wind_speed_ms)
+
+
+def cantilever_moment_kernel(
+    cantilever_length_mm: FloatArray,
+    height_mm: FloatArray,
+    gate_weight_N: FloatArray,
+    wind_load_N: FloatArray,
+) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    """Dead, wind and total overturning moments (N·mm)"""
+    # Gate weight acts at the center of gravity, wind at the center of pressure
+    dead_moment_Nmm = gate_weight_N * (cantilever_length_mm / 2)
+    wind_moment_Nmm = wind_load_N * (height_mm / 2)
+
+    return dead_moment_Nmm, wind_moment_Nmm, dead_moment_Nmm + wind_moment_Nmm
+
+
+def counterweight_kernel(
+    counterweight_length_mm: FloatArray,
+    overturning_moment_Nmm: FloatArray,
+    safety_factor: float,
+) -> FloatArray:
+    """Required counterweight (N) including safety factor"""
+    return (overturning_moment_Nmm * safety_factor) / counterweight_length_mm
+
+
+def track_loads_kernel(
+    gate_weight_N: FloatArray, counterweight_N: FloatArray
+) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    """Front wheel, rear wheel and horizontal track loads (N)"""
+    # Vertical loads, assuming 2 front wheels
+    front_wheel_load_N = gate_weight_N / 2
+    rear_wheel_load_N = front_wheel_load_N + counterweight_N
+
+    # Horizontal loads (from wind and friction), 10% friction coefficient
+    horizontal_load_N = gate_weight_N * 0.1
+
+    return front_wheel_load_N, rear_wheel_load_N, horizontal_load_N
+
+
+def beam_stress_kernel(
+    moment_Nmm: FloatArray, section_modulus_mm3: FloatArray
+) -> FloatArray:
+    """Bending stress from moment and section modulus"""
+    return moment_Nmm / section_modulus_mm3
+
+
+def deflection_kernel(
+    load_N: FloatArray,
+    length_mm: FloatArray,
+    elastic_modulus_Pa: FloatArray,
+    moment_of_inertia_mm4: FloatArray,
+) -> FloatArray:
+    """Tip deflection (mm) of a cantilever beam with end load"""
+    # Explicit cube: length**3 goes through the generic pow routine, which is
+    # several times slower than two multiplies on both floats and arrays
+    length_cubed_mm3 = length_mm * length_mm * length_mm
+    return (load_N * length_cubed_mm3) / (
+        3 * elastic_modulus_Pa * moment_of_inertia_mm4
+    )
+
+
+def cantilever_design_kernel(
+    width_mm: FloatArray,
+    height_mm: FloatArray,
+    cantilever_length_mm: FloatArray,
+    counterweight_length_mm: FloatArray,
+    wind_speed_ms: FloatArray,
+    frame_section_area_mm2: FloatArray,
+    section_modulus_mm3: FloatArray,
+    moment_of_inertia_mm4: FloatArray,
+    density_kg_m3: float,
+    elastic_modulus_Pa: float,
+    safety_factor: float,
+    infill_weight_kg_m2: FloatArray = 25.0,
+) -> Tuple[FloatArray, ...]:
+    """
+    Complete cantilever gate calculation chain in one flat call
+
+    Runs every kernel in sequence without intermediate dicts or method calls.
+
+    Returns:
+        Tuple of values in DESIGN_RESULT_KEYS order
+    """
+    gate_weight_N = gate_weight_kernel(
+        width_mm, height_mm, frame_section_area_mm2, density_kg_m3, infill_weight_kg_m2
+    )
+    wind_load_N = wind_load_kernel(width_mm, height_mm, wind_speed_ms)
+    dead_moment_Nmm, wind_moment_Nmm, total_overturning_Nmm = cantilever_moment_kernel(
+        cantilever_length_mm, height_mm, gate_weight_N, wind_load_N
+    )
+    counterweight_N = counterweight_kernel(
+        counterweight_length_mm, total_overturning_Nmm, safety_factor
+    )
+    front_wheel_load_N, rear_wheel_load_N, horizontal_load_N = track_loads_kernel(
+        gate_weight_N, counterweight_N
+    )
+    beam_stress_Pa = beam_stress_kernel(total_overturning_Nmm, section_modulus_mm3)
+    deflection_mm = deflection_kernel(
+        gate_weight_N, cantilever_length_mm, elastic_modulus_Pa, moment_of_inertia_mm4
+    )
+
+    return (
+        gate_weight_N,
+        gate_weight_N * N_TO_KG,
+        wind_load_N,
+        dead_moment_Nmm,
+        wind_moment_Nmm,
+        total_overturning_Nmm,
+        counterweight_N,
+        counterweight_N * N_TO_KG,
+        front_wheel_load_N,
+        rear_wheel_load_N,
+        horizontal_load_N,
+        beam_stress_Pa,
+        beam_stress_Pa * PA_TO_MPA,
+        deflection_mm,
+    )
+
+
+# Names of the values returned by cantilever_design_kernel, in order
+DESIGN_RESULT_KEYS = (
+    "gate_weight_N",
+    "gate_weight_kg",
+    "wind_load_N",
+    "dead_moment_Nmm",
+    "wind_moment_Nmm",
+    "total_overturning_Nmm",
+    "counterweight_N",
+    "counterweight_kg",
+    "front_wheel_load_N",
+    "rear_wheel_load_N",
+    "horizontal_load_N",
+    "beam_stress_Pa",
+    "beam_stress_MPa",
+    "deflection_mm",
+)
+
+# Structured record layout for batches of design results
+DESIGN_RESULT_DTYPE = np.dtype([(key, "f8") for key in DESIGN_RESULT_KEYS])
+
 
 class CantileverCalculations:
-    """Structural calculations for cantilever slide gates"""
+    """
+    Structural calculations for cantilever slide gates
+
+    All methods are elementwise algebra, so they accept either a single
+    GateGeometry or a GateGeometryArray (and matching scalar or array loads)
+    and evaluate a whole parameter sweep in one vectorized pass.
+    """
 
     def __init__(self, steel_properties: SteelProperties):
         self.steel = steel_properties
@@ -42,10 +348,10 @@ class CantileverCalculations:
 
     def calculate_gate_weight(
         self,
-        geometry: GateGeometry,
-        frame_section_area_mm2: float,
-        infill_weight_kg_m2: float = 25.0,
-    ) -> float:
+        geometry: Geometry,
+        frame_section_area_mm2: FloatArray,
+        infill_weight_kg_m2: FloatArray = 25.0,
+    ) -> FloatArray:
         """
         Calculate total gate weight in Newtons
 
@@ -57,23 +363,17 @@ class CantileverCalculations:
         Returns:
             Total gate weight in Newtons
         """
-        # Frame weight calculation
-        frame_perimeter_mm = 2 * (geometry.width_mm + geometry.height_mm)
-        frame_volume_mm3 = frame_perimeter_mm * frame_section_area_mm2
-        frame_weight_kg = frame_volume_mm3 * self.steel.density_kg_m3 / 1e9
-
-        # Infill weight calculation
-        infill_area_m2 = (geometry.width_mm * geometry.height_mm) / 1e6
-        infill_weight_kg = infill_area_m2 * infill_weight_kg_m2
-
-        # Total weight in Newtons
-        total_weight_N = (frame_weight_kg + infill_weight_kg) * GRAVITY_MS2
-
-        return total_weight_N
+        return gate_weight_kernel(
+            geometry.width_mm,
+            geometry.height_mm,
+            frame_section_area_mm2,
+            self.steel.density_kg_m3,
+            infill_weight_kg_m2,
+        )
 
     def calculate_wind_load(
-        self, geometry: GateGeometry, wind_speed_ms: float = 33.5
-    ) -> float:
+        self, geometry: Geometry, wind_speed_ms: FloatArray = 33.5
+    ) -> FloatArray:
         """
         Calculate wind load on gate per ASCE 7
 
@@ -84,23 +384,18 @@ class CantileverCalculations:
         Returns:
             Wind load in Newtons
         """
-        # Wind pressure calculation (ASCE 7-16)
-        dynamic_pressure_Pa = 0.613 * wind_speed_ms**2
-
-        # Drag coefficient for rectangular gate
-        drag_coefficient = 1.2
+        # Scalar speeds reuse a memoized evaluator; the calculator itself holds
+        # no per-call state, so it is safe to share between threads
+        if np.ndim(wind_speed_ms):
+            evaluator = WindLoadEvaluator(wind_speed_ms)
+        else:
+            evaluator = _wind_evaluator_for(float(wind_speed_ms))
 
-        # Exposed area
-        exposed_area_m2 = (geometry.width_mm * geometry.height_mm) / 1e6
-
-        # Wind load
-        wind_load_N = dynamic_pressure_Pa * drag_coefficient * exposed_area_m2
-
-        return wind_load_N
+        return evaluator(geometry.width_mm, geometry.height_mm)
 
     def calculate_cantilever_moment(
-        self, geometry: GateGeometry, gate_weight_N: float, wind_load_N: float
-    ) -> Dict[str, float]:
+        self, geometry: Geometry, gate_weight_N: FloatArray, wind_load_N: FloatArray
+    ) -> Dict[str, FloatArray]:
         """
         Calculate moments in cantilever beam
 
@@ -112,20 +407,14 @@ class CantileverCalculations:
         Returns:
             Dictionary of moment values
         """
-        # Moment arm for gate weight (to center of gravity)
-        weight_moment_arm_mm = geometry.cantilever_length_mm / 2
-
-        # Moment arm for wind load (to center of pressure)
-        wind_moment_arm_mm = geometry.height_mm / 2
-
-        # Dead load moment (overturning)
-        dead_moment_Nmm = gate_weight_N * weight_moment_arm_mm
-
-        # Wind moment (overturning)
-        wind_moment_Nmm = wind_load_N * wind_moment_arm_mm
-
-        # Total overturning moment
-        total_overturning_Nmm = dead_moment_Nmm + wind_moment_Nmm
+        dead_moment_Nmm, wind_moment_Nmm, total_overturning_Nmm = (
+            cantilever_moment_kernel(
+                geometry.cantilever_length_mm,
+                geometry.height_mm,
+                gate_weight_N,
+                wind_load_N,
+            )
+        )
 
         return {
             "dead_moment_Nmm": dead_moment_Nmm,
@@ -134,8 +423,8 @@ class CantileverCalculations:
         }
 
     def calculate_counterweight_requirement(
-        self, geometry: GateGeometry, overturning_moment_Nmm: float
-    ) -> float:
+        self, geometry: Geometry, overturning_moment_Nmm: FloatArray
+    ) -> FloatArray:
         """
         Calculate required counterweight
 
@@ -146,20 +435,16 @@ class CantileverCalculations:
         Returns:
             Required counterweight in Newtons
         """
-        # Counterweight moment arm
-        cw_moment_arm_mm = geometry.counterweight_length_mm
-
-        # Required counterweight with safety factor
-        required_cw_N = (overturning_moment_Nmm * self.safety_factor) / cw_moment_arm_mm
-
-        return required_cw_N
+        return counterweight_kernel(
+            geometry.counterweight_length_mm, overturning_moment_Nmm, self.safety_factor
+        )
 
     def calculate_track_loads(
         self,
-        geometry: GateGeometry,
-        gate_weight_N: float,
-        counterweight_N: float,
-    ) -> Dict[str, float]:
+        geometry: Geometry,
+        gate_weight_N: FloatArray,
+        counterweight_N: FloatArray,
+    ) -> Dict[str, FloatArray]:
         """
         Calculate loads on track structure
 
@@ -171,12 +456,9 @@ class CantileverCalculations:
         Returns:
             Dictionary of track load values
         """
-        # Vertical loads
-        front_wheel_load_N = gate_weight_N / 2  # Assuming 2 front wheels
-        rear_wheel_load_N = (gate_weight_N / 2) + counterweight_N
-
-        # Horizontal loads (from wind and friction)
-        horizontal_load_N = gate_weight_N * 0.1  # 10% friction coefficient
+        front_wheel_load_N, rear_wheel_load_N, horizontal_load_N = track_loads_kernel(
+            gate_weight_N, counterweight_N
+        )
 
         return {
             "front_wheel_load_N": front_wheel_load_N,
@@ -185,8 +467,8 @@ class CantileverCalculations:
         }
 
     def calculate_beam_stress(
-        self, moment_Nmm: float, section_modulus_mm3: float
-    ) -> float:
+        self, moment_Nmm: FloatArray, section_modulus_mm3: FloatArray
+    ) -> FloatArray:
         """
         Calculate bending stress in beam
 
@@ -197,12 +479,11 @@ class CantileverCalculations:
         Returns:
             Bending stress in Pa
         """
-        stress_Pa = moment_Nmm / section_modulus_mm3
-        return stress_Pa
+        return beam_stress_kernel(moment_Nmm, section_modulus_mm3)
 
     def check_beam_adequacy(
-        self, applied_stress_Pa: float, allowable_stress_Pa: float
-    ) -> Dict[str, float]:
+        self, applied_stress_Pa: FloatArray, allowable_stress_Pa: FloatArray
+    ) -> Dict[str, FloatArray]:
         """
         Check beam adequacy against allowable stress
 
@@ -223,8 +504,11 @@ class CantileverCalculations:
         }
 
     def calculate_deflection(
-        self, load_N: float, length_mm: float, moment_of_inertia_mm4: float
-    ) -> float:
+        self,
+        load_N: FloatArray,
+        length_mm: FloatArray,
+        moment_of_inertia_mm4: FloatArray,
+    ) -> FloatArray:
         """
         Calculate beam deflection
 
@@ -236,9 +520,6 @@ class CantileverCalculations:
         Returns:
             Deflection in mm
         """
-        # For cantilever beam with end load
-        deflection_mm = (load_N * length_mm**3) / (
-            3 * self.steel.elastic_modulus_Pa * moment_of_inertia_mm4
+        return deflection_kernel(
+            load_N, length_mm, self.steel.elastic_modulus_Pa, moment_of_inertia_mm4
         )
-
-        return deflection_mm
@@ -3,6 +3,9 @@
 Demo script for cantilever slide gate design tool
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from designs.gate_designer import CantileverGateDesigner, DesignRequirements
 from utils.config import load_config
 
@@ -42,9 +45,15 @@ def run_demo():
         gate_design = designer.create_design(requirements)
         
         print("Generating outputs...")
-        designer.generate_calculations(gate_design)
-        designer.generate_drawings(gate_design)
-        designer.generate_documentation(gate_design)
+        # Output files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(designer.generate_calculations, gate_design),
+                executor.submit(designer.generate_drawings, gate_design),
+                executor.submit(designer.generate_documentation, gate_design),
+            ]
+            for future in futures:
+                future.result()
         
         print("\n" + "=" * 60)
         print("DEMO COMPLETED SUCCESSFULLY!")
@@ -74,4 +83,5 @@ def run_demo():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     run_demo()
@@ -2,16 +2,87 @@
 Main gate designer class for cantilever slide gates
 """
 
-from typing import Dict, List
+import logging
+from typing import Dict, List, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-import json
 
-from calculations.structural_analysis import CantileverCalculations, GateGeometry
+import numpy as np
+
+from calculations.structural_analysis import (
+    CantileverCalculations,
+    DESIGN_RESULT_DTYPE,
+    DESIGN_RESULT_KEYS,
+    cantilever_design_kernel,
+    GEOM_DTYPE,
+    Geometry,
+    GateGeometry,
+    GateGeometryArray,
+)
+from utils.config import Config
 from utils.material_properties import get_steel_properties
+from utils.serialization import write_json
+from utils.disk_cache import disk_cached
 from reference.tymetal_fortress import TymetalFortressReference
 from documentation.report_generator import ReportGenerator
 
+logger = logging.getLogger(__name__)
+
+# Persistent design cache (opt-in through output_settings.cache_designs);
+# bump the version whenever design calculations, limits or tables change
+DESIGN_CACHE_DIR = Path("output") / ".cache"
+_CACHE_VERSION = 1
+
+# Design adequacy limits (simplified checks)
+ALLOWABLE_BEAM_STRESS_MPA = 200.0
+ALLOWABLE_DEFLECTION_MM = 50.0  # L/240 limit
+MAX_COUNTERWEIGHT_TO_GATE_WEIGHT = 2.0
+
+# Columns of each material list entry
+MATERIAL_LIST_FIELDS = ("item", "size", "length_mm", "weight_kg", "material")
+
+# Adequacy note flags, combined into one bitmask per design
+NOTE_BEAM_STRESS = 1
+NOTE_DEFLECTION = 2
+NOTE_HEAVY_COUNTERWEIGHT = 4
+
+DESIGN_NOTE_TEXT = {
+    NOTE_BEAM_STRESS: "Beam stress exceeds allowable limits",
+    NOTE_DEFLECTION: "Deflection exceeds allowable limits",
+    NOTE_HEAVY_COUNTERWEIGHT: "Counterweight is very heavy - consider design optimization",
+}
+
+
+def design_notes_for(note_flags: int) -> List[str]:
+    """Expand a bitmask of NOTE_* flags into design note strings"""
+    return [text for flag, text in DESIGN_NOTE_TEXT.items() if note_flags & flag]
+
+
+@lru_cache(maxsize=4096)
+def _geometry_for(width_mm: float, height_mm: float) -> GateGeometry:
+    """
+    Gate geometry for a given gate size
+
+    Memoized on (width, height): optimizers revisit the same sizes, and the
+    returned GateGeometry is frozen so sharing cached instances is safe.
+    """
+
+    # Apply scaling with engineering judgment based on requirements
+    cantilever_length = width_mm * 0.5  # 50% of width
+    track_length = width_mm * 1.5  # 150% of width
+    counterweight_length = width_mm * 0.3  # 30% of width
+    frame_depth = min(200, height_mm * 0.1)  # 10% of height, max 200mm
+
+    return GateGeometry(
+        width_mm=width_mm,
+        height_mm=height_mm,
+        cantilever_length_mm=cantilever_length,
+        track_length_mm=track_length,
+        counterweight_length_mm=counterweight_length,
+        frame_depth_mm=frame_depth,
+    )
+
 
 @dataclass
 class DesignRequirements:
@@ -42,10 +113,20 @@ class GateDesign:
 class CantileverGateDesigner:
     """Main designer class for cantilever slide gates"""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Config):
         self.config = config
-        self.reference = TymetalFortressReference()
+        self.use_disk_cache = config.output_settings.cache_designs
+        self.reference = TymetalFortressReference.shared()
         self.report_generator = ReportGenerator()
+        self._calc_cache: Dict[str, CantileverCalculations] = {}
+
+    def _calculator_for(self, steel_grade: str) -> CantileverCalculations:
+        """Structural calculator for a steel grade, reused across designs"""
+        calc = self._calc_cache.get(steel_grade)
+        if calc is None:
+            calc = CantileverCalculations(get_steel_properties(steel_grade))
+            self._calc_cache[steel_grade] = calc
+        return calc
 
     def create_design(self, requirements: DesignRequirements) -> GateDesign:
         """
@@ -57,21 +138,34 @@ class CantileverGateDesigner:
         Returns:
             Complete gate design
         """
-        print(
-            f"Creating design for {requirements.gate_width_mm / 1000:.1f}m x {requirements.gate_height_mm / 1000:.1f}m gate"
+        logger.info(
+            "Creating design for %.1fm x %.1fm gate",
+            requirements.gate_width_mm / 1000,
+            requirements.gate_height_mm / 1000,
         )
 
-        # Get material properties
-        steel = get_steel_properties(requirements.steel_grade)
+        design = self._build_design(requirements)
+
+        # Create output directory (also needed when the design came from cache)
+        design.output_path.mkdir(parents=True, exist_ok=True)
+
+        return design
+
+    @disk_cached(DESIGN_CACHE_DIR, _CACHE_VERSION)
+    def _build_design(self, requirements: DesignRequirements) -> GateDesign:
+        """Compute the gate design; memoized on disk keyed on the requirements"""
 
-        # Initialize structural calculator
-        calc = CantileverCalculations(steel)
+        # Structural calculator and material properties for the steel grade
+        calc = self._calculator_for(requirements.steel_grade)
+        steel = calc.steel
 
         # Determine gate geometry based on requirements and reference design
         geometry = self._determine_geometry(requirements)
 
         # Perform structural calculations
-        structural_results = self._perform_calculations(calc, geometry, requirements)
+        structural_results = self._perform_calculations(
+            calc, geometry, requirements.wind_speed_ms
+        )
 
         # Check design adequacy
         is_adequate, design_notes = self._check_design_adequacy(structural_results)
@@ -79,8 +173,8 @@ class CantileverGateDesigner:
         # Generate material list
         material_list = self._generate_material_list(geometry, steel)
 
-        # Create output directory
-        output_path = self._create_output_directory(requirements)
+        # Output directory for design files
+        output_path = self._output_directory(requirements)
 
         # Create design object
         design = GateDesign(
@@ -97,149 +191,185 @@ class CantileverGateDesigner:
 
     def _determine_geometry(self, requirements: DesignRequirements) -> GateGeometry:
         """Determine gate geometry based on requirements"""
+        return _geometry_for(requirements.gate_width_mm, requirements.gate_height_mm)
+
+    def evaluate_design_space(
+        self,
+        width_mm: np.ndarray,
+        height_mm: np.ndarray,
+        wind_speed_ms: float | np.ndarray = 33.5,
+        steel_grade: str = "A572_50",
+    ) -> np.ndarray:
+        """
+        Evaluate structural results for a whole sweep of gate sizes at once
 
-        # Apply scaling with engineering judgment based on requirements
-        cantilever_length = requirements.gate_width_mm * 0.5  # 50% of width
-        track_length = requirements.gate_width_mm * 1.5  # 150% of width
-        counterweight_length = requirements.gate_width_mm * 0.3  # 30% of width
-        frame_depth = min(
-            200, requirements.gate_height_mm * 0.1
-        )  # 10% of height, max 200mm
-
-        geometry = GateGeometry(
-            width_mm=requirements.gate_width_mm,
-            height_mm=requirements.gate_height_mm,
-            cantilever_length_mm=cantilever_length,
-            track_length_mm=track_length,
-            counterweight_length_mm=counterweight_length,
-            frame_depth_mm=frame_depth,
+        Args:
+            width_mm: Candidate gate widths (any shape broadcastable with height)
+            height_mm: Candidate gate heights
+            wind_speed_ms: Design wind speed, scalar or per-candidate array
+            steel_grade: Steel grade used for every candidate
+
+        Returns:
+            DESIGN_RESULT_DTYPE structured array, one record per candidate,
+            indexable by result name like the single-design results dict
+        """
+        calc = self._calculator_for(steel_grade)
+
+        records = self._determine_geometry_records(width_mm, height_mm)
+        geometry = GateGeometryArray.from_records(records)
+
+        # Preallocate every result field, then fill from the fused kernel
+        results = np.empty(records.shape, dtype=DESIGN_RESULT_DTYPE)
+        values = self._run_design_kernel(calc, geometry, wind_speed_ms)
+        for key, value in zip(DESIGN_RESULT_KEYS, values):
+            results[key] = value
+
+        return results
+
+    def _determine_geometry_records(
+        self, width_mm: np.ndarray, height_mm: np.ndarray
+    ) -> np.ndarray:
+        """Batch form of _determine_geometry, one GEOM_DTYPE record per design"""
+
+        width_mm, height_mm = np.broadcast_arrays(
+            np.asarray(width_mm, dtype=np.float64),
+            np.asarray(height_mm, dtype=np.float64),
         )
 
-        return geometry
+        # Same proportions as _geometry_for, applied elementwise
+        records = np.empty(width_mm.shape, dtype=GEOM_DTYPE)
+        records["width_mm"] = width_mm
+        records["height_mm"] = height_mm
+        records["cantilever_length_mm"] = width_mm * 0.5
+        records["track_length_mm"] = width_mm * 1.5
+        records["counterweight_length_mm"] = width_mm * 0.3
+        records["frame_depth_mm"] = np.minimum(200, height_mm * 0.1)
+
+        return records
 
     def _perform_calculations(
         self,
         calc: CantileverCalculations,
-        geometry: GateGeometry,
-        requirements: DesignRequirements,
-    ) -> Dict[str, float]:
-        """Perform all structural calculations"""
+        geometry: Geometry,
+        wind_speed_ms: float | np.ndarray,
+    ) -> Dict[str, float | np.ndarray]:
+        """Perform all structural calculations (scalar or batched geometry)"""
+
+        # All result keys are known up front, so build the dict in one pass
+        return dict(
+            zip(
+                DESIGN_RESULT_KEYS,
+                self._run_design_kernel(calc, geometry, wind_speed_ms),
+            )
+        )
 
-        results = {}
+    def _run_design_kernel(
+        self,
+        calc: CantileverCalculations,
+        geometry: Geometry,
+        wind_speed_ms: float | np.ndarray,
+    ) -> Tuple[float | np.ndarray, ...]:
+        """Run the fused calculation chain, values in DESIGN_RESULT_KEYS order"""
 
-        # Calculate gate weight
+        # Simplified section assumptions for the frame members
         frame_area_mm2 = 2500  # Assumed frame section area
-        gate_weight_N = calc.calculate_gate_weight(geometry, frame_area_mm2)
-        results["gate_weight_N"] = gate_weight_N
-        results["gate_weight_kg"] = gate_weight_N / 9.81
+        section_modulus_mm3 = 1e6  # Assumed section modulus
+        moment_of_inertia_mm4 = 1e8  # Assumed moment of inertia
 
-        # Calculate wind load
-        wind_load_N = calc.calculate_wind_load(geometry, requirements.wind_speed_ms)
-        results["wind_load_N"] = wind_load_N
+        return cantilever_design_kernel(
+            geometry.width_mm,
+            geometry.height_mm,
+            geometry.cantilever_length_mm,
+            geometry.counterweight_length_mm,
+            wind_speed_ms,
+            frame_area_mm2,
+            section_modulus_mm3,
+            moment_of_inertia_mm4,
+            calc.steel.density_kg_m3,
+            calc.steel.elastic_modulus_Pa,
+            calc.safety_factor,
+        )
 
-        # Calculate moments
-        moments = calc.calculate_cantilever_moment(geometry, gate_weight_N, wind_load_N)
-        results.update(moments)
+    def check_adequacy_batch(
+        self, results: Dict[str, np.ndarray] | np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check adequacy of a batch of designs (e.g. from evaluate_design_space)
 
-        # Calculate required counterweight
-        counterweight_N = calc.calculate_counterweight_requirement(
-            geometry, moments["total_overturning_Nmm"]
-        )
-        results["counterweight_N"] = counterweight_N
-        results["counterweight_kg"] = counterweight_N / 9.81
+        Args:
+            results: Structural results with one array entry per design
 
-        # Calculate track loads
-        track_loads = calc.calculate_track_loads(
-            geometry, gate_weight_N, counterweight_N
-        )
-        results.update(track_loads)
+        Returns:
+            Tuple of (is_adequate bool array, uint8 array of NOTE_* flags)
+        """
+        # Check stress and deflection limits
+        mask_stress = np.asarray(results["beam_stress_MPa"]) > ALLOWABLE_BEAM_STRESS_MPA
+        mask_deflection = np.asarray(results["deflection_mm"]) > ALLOWABLE_DEFLECTION_MM
 
-        # Calculate beam stresses (simplified)
-        section_modulus_mm3 = 1e6  # Assumed section modulus
-        beam_stress_Pa = calc.calculate_beam_stress(
-            moments["total_overturning_Nmm"], section_modulus_mm3
+        # Check counterweight reasonableness
+        mask_counterweight = np.asarray(results["counterweight_kg"]) > (
+            np.asarray(results["gate_weight_kg"]) * MAX_COUNTERWEIGHT_TO_GATE_WEIGHT
         )
-        results["beam_stress_Pa"] = beam_stress_Pa
-        results["beam_stress_MPa"] = beam_stress_Pa / 1e6
 
-        # Calculate deflection
-        moment_of_inertia_mm4 = 1e8  # Assumed moment of inertia
-        deflection_mm = calc.calculate_deflection(
-            gate_weight_N, geometry.cantilever_length_mm, moment_of_inertia_mm4
-        )
-        results["deflection_mm"] = deflection_mm
+        is_adequate = ~(mask_stress | mask_deflection)
+        note_flags = (
+            mask_stress * NOTE_BEAM_STRESS
+            | mask_deflection * NOTE_DEFLECTION
+            | mask_counterweight * NOTE_HEAVY_COUNTERWEIGHT
+        ).astype(np.uint8)
 
-        return results
+        return is_adequate, note_flags
 
     def _check_design_adequacy(self, results: Dict[str, float]) -> tuple:
         """Check if design is adequate"""
 
-        is_adequate = True
-        notes = []
+        is_adequate, note_flags = self.check_adequacy_batch(results)
 
-        # Check stress limits
-        if results["beam_stress_MPa"] > 200:  # Simplified check
-            is_adequate = False
-            notes.append("Beam stress exceeds allowable limits")
-
-        # Check deflection limits
-        if results["deflection_mm"] > 50:  # L/240 limit
-            is_adequate = False
-            notes.append("Deflection exceeds allowable limits")
-
-        # Check counterweight reasonableness
-        if results["counterweight_kg"] > results["gate_weight_kg"] * 2:
-            notes.append("Counterweight is very heavy - consider design optimization")
-
-        return is_adequate, notes
+        return bool(is_adequate), design_notes_for(int(note_flags))
 
     def _generate_material_list(self, geometry: GateGeometry, steel) -> List[Dict]:
         """Generate material list for the gate"""
 
-        materials = []
-
-        # Main frame members
-        materials.append(
-            {
-                "item": "Main Frame HSS",
-                "size": "150x150x6",
-                "length_mm": 2 * (geometry.width_mm + geometry.height_mm),
-                "weight_kg": 150,  # Estimated
-                "material": steel.grade,
-            }
-        )
-
-        # Track rail
-        materials.append(
-            {
-                "item": "Track Rail",
-                "size": "CR135",
-                "length_mm": geometry.track_length_mm,
-                "weight_kg": 135 * geometry.track_length_mm / 1000,
-                "material": steel.grade,
-            }
+        # One row per item in MATERIAL_LIST_FIELDS order; None omits the field
+        rows = (
+            # Main frame members (weight estimated)
+            ("Main Frame HSS", "150x150x6", geometry.perimeter_mm, 150, steel.grade),
+            # Track rail
+            (
+                "Track Rail",
+                "CR135",
+                geometry.track_length_mm,
+                135 * geometry.track_length_mm / 1000,
+                steel.grade,
+            ),
+            # Counterweight (weight estimated)
+            (
+                "Counterweight",
+                "Concrete Block",
+                None,
+                geometry.counterweight_length_mm * 0.5,
+                "Concrete",
+            ),
         )
 
-        # Counterweight
-        materials.append(
+        materials = [
             {
-                "item": "Counterweight",
-                "size": "Concrete Block",
-                "weight_kg": geometry.counterweight_length_mm * 0.5,  # Estimated
-                "material": "Concrete",
+                key: value
+                for key, value in zip(MATERIAL_LIST_FIELDS, row)
+                if value is not None
             }
-        )
+            for row in rows
+        ]
 
         return materials
 
-    def _create_output_directory(self, requirements: DesignRequirements) -> Path:
-        """Create output directory for design files"""
+    def _output_directory(self, requirements: DesignRequirements) -> Path:
+        """Output directory for design files"""
 
         output_dir = (
             Path("output")
             / f"gate_{requirements.gate_width_mm / 1000:.1f}x{requirements.gate_height_mm / 1000:.1f}m"
         )
-        output_dir.mkdir(parents=True, exist_ok=True)
 
         return output_dir
 
@@ -247,31 +377,26 @@ class CantileverGateDesigner:
         """Generate calculation report"""
         calc_file = design.output_path / "structural_calculations.json"
 
-        with open(calc_file, "w") as f:
-            json.dump(design.structural_results, f, indent=2)
+        write_json(calc_file, design.structural_results)
 
-        print(f"Calculations saved to: {calc_file}")
+        logger.info("Calculations saved to: %s", calc_file)
 
     def generate_drawings(self, design: GateDesign):
         """Generate technical drawings"""
         # This would integrate with CAD tools
         drawing_file = design.output_path / "gate_drawings.txt"
 
-        with open(drawing_file, "w") as f:
-            f.write("CANTILEVER SLIDE GATE DRAWINGS\n")
-            f.write("=" * 40 + "\n\n")
-            f.write(
-                f"Gate Dimensions: {design.geometry.width_mm / 1000:.1f}m x {design.geometry.height_mm / 1000:.1f}m\n"
-            )
-            f.write(
-                f"Cantilever Length: {design.geometry.cantilever_length_mm / 1000:.1f}m\n"
-            )
-            f.write(f"Track Length: {design.geometry.track_length_mm / 1000:.1f}m\n")
-            f.write(
-                f"Counterweight Length: {design.geometry.counterweight_length_mm / 1000:.1f}m\n"
-            )
+        geometry = design.geometry
+        drawing_file.write_text(
+            "CANTILEVER SLIDE GATE DRAWINGS\n"
+            f"{'=' * 40}\n\n"
+            f"Gate Dimensions: {geometry.width_mm / 1000:.1f}m x {geometry.height_mm / 1000:.1f}m\n"
+            f"Cantilever Length: {geometry.cantilever_length_mm / 1000:.1f}m\n"
+            f"Track Length: {geometry.track_length_mm / 1000:.1f}m\n"
+            f"Counterweight Length: {geometry.counterweight_length_mm / 1000:.1f}m\n"
+        )
 
-        print(f"Drawings saved to: {drawing_file}")
+        logger.info("Drawings saved to: %s", drawing_file)
 
     def generate_documentation(self, design: GateDesign):
         """Generate project documentation"""
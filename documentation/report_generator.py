@@ -2,9 +2,15 @@
 Report generator for cantilever slide gate documentation
 """
 
+import logging
+from dataclasses import asdict
 from pathlib import Path
-import json
 from datetime import datetime
+from typing import Iterable
+
+from utils.serialization import json_line, write_json
+
+logger = logging.getLogger(__name__)
 
 
 class ReportGenerator:
@@ -26,69 +32,86 @@ class ReportGenerator:
         # Generate specifications
         self._generate_specifications(design)
         
-        print(f"Complete documentation generated in: {design.output_path}")
+        logger.info("Complete documentation generated in: %s", design.output_path)
+    
+    def write_batch_jsonl(self, path: Path, designs: Iterable) -> int:
+        """
+        Stream requirements and results of many designs into one JSONL file
+        
+        Args:
+            path: Output file path
+            designs: Gate designs to record, one line each
+        
+        Returns:
+            Number of designs written
+        """
+        count = 0
+        with open(path, 'wb') as f:
+            for design in designs:
+                f.write(json_line({"req": asdict(design.requirements), "res": design.structural_results}))
+                count += 1
+        
+        logger.info("Wrote %d designs to: %s", count, path)
+        return count
     
     def _generate_calculation_summary(self, design):
         """Generate calculation summary report"""
         
         report_file = design.output_path / "calculation_summary.txt"
+        results = design.structural_results
+        
+        notes = ""
+        if design.design_notes:
+            notes = "Design Notes:\n" + "".join(f"  - {note}\n" for note in design.design_notes)
         
-        with open(report_file, 'w') as f:
-            f.write("CANTILEVER SLIDE GATE CALCULATION SUMMARY\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write(f"Project Date: {datetime.now().strftime('%Y-%m-%d')}\n")
-            f.write(f"Gate Size: {design.geometry.width_mm/1000:.1f}m x {design.geometry.height_mm/1000:.1f}m\n")
-            f.write(f"Steel Grade: {design.requirements.steel_grade}\n")
-            f.write(f"Design Wind Speed: {design.requirements.wind_speed_ms:.1f} m/s\n\n")
-            
-            f.write("STRUCTURAL RESULTS:\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Gate Weight: {design.structural_results['gate_weight_kg']:.1f} kg\n")
-            f.write(f"Counterweight: {design.structural_results['counterweight_kg']:.1f} kg\n")
-            f.write(f"Wind Load: {design.structural_results['wind_load_N']:.1f} N\n")
-            f.write(f"Beam Stress: {design.structural_results['beam_stress_MPa']:.1f} MPa\n")
-            f.write(f"Deflection: {design.structural_results['deflection_mm']:.1f} mm\n\n")
-            
-            f.write("DESIGN ADEQUACY:\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Design Status: {'ADEQUATE' if design.is_adequate else 'NEEDS REVISION'}\n")
-            if design.design_notes:
-                f.write("Design Notes:\n")
-                for note in design.design_notes:
-                    f.write(f"  - {note}\n")
+        report_file.write_text(
+            "CANTILEVER SLIDE GATE CALCULATION SUMMARY\n"
+            f"{'=' * 50}\n\n"
+            f"Project Date: {datetime.now().strftime('%Y-%m-%d')}\n"
+            f"Gate Size: {design.geometry.width_mm/1000:.1f}m x {design.geometry.height_mm/1000:.1f}m\n"
+            f"Steel Grade: {design.requirements.steel_grade}\n"
+            f"Design Wind Speed: {design.requirements.wind_speed_ms:.1f} m/s\n\n"
+            "STRUCTURAL RESULTS:\n"
+            f"{'-' * 20}\n"
+            f"Gate Weight: {results['gate_weight_kg']:.1f} kg\n"
+            f"Counterweight: {results['counterweight_kg']:.1f} kg\n"
+            f"Wind Load: {results['wind_load_N']:.1f} N\n"
+            f"Beam Stress: {results['beam_stress_MPa']:.1f} MPa\n"
+            f"Deflection: {results['deflection_mm']:.1f} mm\n\n"
+            "DESIGN ADEQUACY:\n"
+            f"{'-' * 20}\n"
+            f"Design Status: {'ADEQUATE' if design.is_adequate else 'NEEDS REVISION'}\n"
+            f"{notes}"
+        )
     
     def _generate_material_list(self, design):
         """Generate detailed material list"""
         
         material_file = design.output_path / "material_list.json"
         
-        with open(material_file, 'w') as f:
-            json.dump(design.material_list, f, indent=2)
+        write_json(material_file, design.material_list)
     
     def _generate_specifications(self, design):
         """Generate project specifications"""
         
         spec_file = design.output_path / "specifications.txt"
         
-        with open(spec_file, 'w') as f:
-            f.write("CANTILEVER SLIDE GATE SPECIFICATIONS\n")
-            f.write("=" * 40 + "\n\n")
-            
-            f.write("GENERAL REQUIREMENTS:\n")
-            f.write("- Gate shall be cantilever slide type\n")
-            f.write("- All steel shall be hot-dip galvanized\n")
-            f.write("- Gate shall operate smoothly with minimal force\n")
-            f.write("- Design shall comply with local building codes\n\n")
-            
-            f.write("MATERIALS:\n")
-            f.write(f"- Steel Grade: {design.requirements.steel_grade}\n")
-            f.write(f"- Infill Type: {design.requirements.infill_type}\n")
-            f.write("- Hardware: Stainless steel where exposed\n")
-            f.write("- Finish: Hot-dip galvanized per ASTM A123\n\n")
-            
-            f.write("PERFORMANCE REQUIREMENTS:\n")
-            f.write(f"- Wind Load: {design.requirements.wind_speed_ms:.1f} m/s\n")
-            f.write("- Operating Temperature: -40°C to +60°C\n")
-            f.write("- Service Life: 25 years minimum\n")
-            f.write("- Maintenance: Annual inspection required\n")
+        spec_file.write_text(
+            "CANTILEVER SLIDE GATE SPECIFICATIONS\n"
+            f"{'=' * 40}\n\n"
+            "GENERAL REQUIREMENTS:\n"
+            "- Gate shall be cantilever slide type\n"
+            "- All steel shall be hot-dip galvanized\n"
+            "- Gate shall operate smoothly with minimal force\n"
+            "- Design shall comply with local building codes\n\n"
+            "MATERIALS:\n"
+            f"- Steel Grade: {design.requirements.steel_grade}\n"
+            f"- Infill Type: {design.requirements.infill_type}\n"
+            "- Hardware: Stainless steel where exposed\n"
+            "- Finish: Hot-dip galvanized per ASTM A123\n\n"
+            "PERFORMANCE REQUIREMENTS:\n"
+            f"- Wind Load: {design.requirements.wind_speed_ms:.1f} m/s\n"
+            "- Operating Temperature: -40°C to +60°C\n"
+            "- Service Life: 25 years minimum\n"
+            "- Maintenance: Annual inspection required\n"
+        )
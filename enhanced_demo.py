@@ -3,15 +3,26 @@ Enhanced demonstration of the cantilever slide gate design system
 Shows advanced engineering analysis, visualization, and reporting
 """
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cache, lru_cache
+from operator import itemgetter
+from typing import Dict, List, Tuple
 
 import numpy as np
-from src.analysis.advanced_structural import AdvancedStructuralAnalyzer, BeamSection
-from src.visualization.engineering_plots import EngineeringPlotter
-from src.reports.excel_generator import ExcelReportGenerator
+from src.analysis.advanced_structural import (
+    AdvancedStructuralAnalyzer, BeamSection, SECTION_DTYPE, SectionArray
+)
 from src.core.materials import get_material_properties_by_name
+from utils.engineering_constants import GRAVITY_MS2
 
+# ASCE 7 wind pressure factors, folded into one coefficient:
+# velocity pressure 0.613 (SI, standard conditions), gust factor G = 0.85 for
+# rigid structures, pressure coefficient Cp = 1.2 for flat surfaces
+_ASCE7_PRESSURE_COEFF = 0.613 * 0.85 * 1.2
 
+
+@lru_cache(maxsize=256)
 def create_hss_section(name: str, depth_mm: float, width_mm: float, thickness_mm: float) -> BeamSection:
     """
     Create HSS (Hollow Structural Section) properties per AISC standards
@@ -23,7 +34,8 @@ def create_hss_section(name: str, depth_mm: float, width_mm: float, thickness_mm
         thickness_mm: Wall thickness in mm
         
     Returns:
-        BeamSection with calculated properties
+        BeamSection with calculated properties (cached and shared between
+        callers, so treat it as read-only)
     """
     # Input validation
     if depth_mm <= 0 or width_mm <= 0 or thickness_mm <= 0:
@@ -73,6 +85,50 @@ def create_hss_section(name: str, depth_mm: float, width_mm: float, thickness_mm
         ry_mm=ry_mm
     )
 
+def create_hss_sections_batch(names: List[str], depths_mm: np.ndarray, widths_mm: np.ndarray,
+                              thicknesses_mm: np.ndarray) -> np.ndarray:
+    """
+    Create properties for many HSS sections at once (vectorized create_hss_section)
+    
+    Args:
+        names: Section designations
+        depths_mm: Overall depths in mm
+        widths_mm: Overall widths in mm
+        thicknesses_mm: Wall thicknesses in mm
+        
+    Returns:
+        SECTION_DTYPE structured array, one row per section
+    """
+    depth_mm = np.asarray(depths_mm, dtype=np.float64)
+    width_mm = np.asarray(widths_mm, dtype=np.float64)
+    thickness_mm = np.asarray(thicknesses_mm, dtype=np.float64)
+    
+    # Input validation (one guard per rule for the whole batch)
+    if np.any(depth_mm <= 0) or np.any(width_mm <= 0) or np.any(thickness_mm <= 0):
+        raise ValueError(f"Invalid section dimensions in batch: {list(names)}")
+    
+    if np.any(thickness_mm * 2 >= np.minimum(depth_mm, width_mm)):
+        raise ValueError(f"Wall thickness too large for section in batch: {list(names)}")
+    
+    out = np.empty(depth_mm.shape, dtype=SECTION_DTYPE)
+    out['name'] = names
+    out['depth_mm'] = depth_mm
+    out['width_mm'] = width_mm
+    out['thickness_mm'] = thickness_mm
+    
+    # Same AISC formulas as create_hss_section, evaluated elementwise
+    inner_depth_mm = depth_mm - 2 * thickness_mm
+    inner_width_mm = width_mm - 2 * thickness_mm
+    out['area_mm2'] = depth_mm * width_mm - inner_depth_mm * inner_width_mm
+    out['Ix_mm4'] = (depth_mm * width_mm**3 - inner_depth_mm * inner_width_mm**3) / 12
+    out['Iy_mm4'] = (width_mm * depth_mm**3 - inner_width_mm * inner_depth_mm**3) / 12
+    out['Sx_mm3'] = out['Ix_mm4'] / (width_mm / 2)
+    out['Sy_mm3'] = out['Iy_mm4'] / (depth_mm / 2)
+    np.sqrt(out['Ix_mm4'] / out['area_mm2'], out=out['rx_mm'])
+    np.sqrt(out['Iy_mm4'] / out['area_mm2'], out=out['ry_mm'])
+    
+    return out
+
 def calculate_wind_load_per_ASCE7(wind_speed_ms: float, gate_height_mm: float, 
                                  exposure_category: str = 'C') -> float:
     """
@@ -86,22 +142,32 @@ def calculate_wind_load_per_ASCE7(wind_speed_ms: float, gate_height_mm: float,
     Returns:
         Wind pressure in Pa
     """
-    # Convert wind speed to mph for ASCE 7 calculations
-    wind_speed_mph = wind_speed_ms * 2.237
-    
-    # Basic wind pressure (ASCE 7-16 Equation 26.10-1)
-    qz_Pa = 0.613 * (wind_speed_ms)**2  # Simplified for standard conditions
-    
-    # Gust factor (G = 0.85 for rigid structures)
-    G = 0.85
-    
-    # Pressure coefficient (Cp = 1.2 for flat surfaces)
-    Cp = 1.2
-    
-    # Wind pressure
-    wind_pressure_Pa = qz_Pa * G * Cp
+    # qz = 0.613 V² (ASCE 7-16 Eq. 26.10-1, simplified), times G and Cp
+    return _ASCE7_PRESSURE_COEFF * wind_speed_ms * wind_speed_ms
+
+@cache
+def _worker_plotter():
+    """EngineeringPlotter for this process, created once and reused so its
+    figure is recycled across the reports a worker renders"""
+    # engineering_plots selects the Agg backend on import
+    from src.visualization.engineering_plots import EngineeringPlotter
+    return EngineeringPlotter()
+
+def _plot_analysis_report(task: Tuple[Dict, BeamSection, float, str]) -> str:
+    """
+    Render one structural analysis report (runs in a worker process)
     
-    return wind_pressure_Pa
+    Args:
+        task: (analysis result, section, gate width in mm, output path)
+        
+    Returns:
+        Path of the written report
+    """
+    result, section, gate_width_mm, report_path = task
+    _worker_plotter().create_structural_analysis_report(
+        result, section, gate_width_mm, report_path
+    )
+    return report_path
 
 def run_enhanced_demo():
     """Run comprehensive engineering demonstration with proper material properties"""
@@ -111,26 +177,27 @@ def run_enhanced_demo():
     # Gate configuration following engineering standards
     gate_config = {
         'project_name': 'Industrial Security Gate - Enhanced Analysis',
-        'width_mm': 8000,  # 8m wide gate
-        'height_mm': 2400,  # 2.4m high (standard)
-        'wind_speed_ms': 45,  # 45 m/s wind speed (high wind region)
+        'width_mm': 8000.0,  # 8m wide gate
+        'height_mm': 2400.0,  # 2.4m high (standard)
+        'wind_speed_ms': 45.0,  # 45 m/s wind speed (high wind region)
         'material_grade': 'A572_50',  # High-strength steel
         'safety_factor': 2.5,  # Conservative safety factor
-        'gate_weight_kg': 1200,  # Estimated gate weight including infill
+        'gate_weight_kg': 1200.0,  # Estimated gate weight including infill
         'exposure_category': 'C'  # Open terrain exposure
     }
     
     print(f"📊 Analyzing {gate_config['width_mm']/1000:.1f}m × {gate_config['height_mm']/1000:.1f}m gate")
-    print(f"🌪️  Design wind speed: {gate_config['wind_speed_ms']} m/s")
+    print(f"🌪️  Design wind speed: {gate_config['wind_speed_ms']:g} m/s")
     print(f"🏗️  Material grade: {gate_config['material_grade']}")
     
     # Create multiple section options for comparison
-    sections = [
-        create_hss_section("HSS150x150x6", 150, 150, 6),
-        create_hss_section("HSS200x200x8", 200, 200, 8),
-        create_hss_section("HSS250x250x10", 250, 250, 10),
-        create_hss_section("HSS300x300x12", 300, 300, 12)
-    ]
+    section_table = create_hss_sections_batch(
+        ["HSS150x150x6", "HSS200x200x8", "HSS250x250x10", "HSS300x300x12"],
+        depths_mm=[150, 200, 250, 300],
+        widths_mm=[150, 200, 250, 300],
+        thicknesses_mm=[6, 8, 10, 12]
+    )
+    sections = SectionArray(section_table)
     
     # Display section properties
     print("\n📐 Section Properties:")
@@ -138,7 +205,7 @@ def run_enhanced_demo():
         print(f"   {section.name}: Area = {section.area_mm2:.0f} mm², Sx = {section.Sx_mm3:.0f} mm³")
     
     # Initialize analyzer with material properties
-    analyzer = AdvancedStructuralAnalyzer(material_grade=gate_config['material_grade'])
+    analyzer = AdvancedStructuralAnalyzer.shared(gate_config['material_grade'])
     
     # Display material properties
     material_props = analyzer.material
@@ -157,7 +224,7 @@ def run_enhanced_demo():
     
     # Load calculations
     distributed_wind_load_N_per_mm = wind_pressure_Pa * gate_config['height_mm'] / 1000  # N/mm
-    distributed_dead_load_N_per_mm = (gate_config['gate_weight_kg'] * 9.81 / 
+    distributed_dead_load_N_per_mm = (gate_config['gate_weight_kg'] * GRAVITY_MS2 / 
                                      gate_config['width_mm'])  # N/mm
     
     # Generate ASCE 7 load combinations
@@ -168,8 +235,9 @@ def run_enhanced_demo():
     )
     
     # Use governing load combination
-    governing_load_N_per_mm = max(load_combinations.values())
-    governing_combination = max(load_combinations, key=load_combinations.get)
+    governing_combination, governing_load_N_per_mm = max(
+        load_combinations.items(), key=itemgetter(1)
+    )
     
     print(f"\n📈 Load Analysis:")
     print(f"   Wind pressure: {wind_pressure_Pa:.0f} Pa")
@@ -179,68 +247,99 @@ def run_enhanced_demo():
     print(f"   Governing load: {governing_load_N_per_mm:.2f} N/mm")
     
     # Analyze each section
+    # Point loads (hardware, operators, safety systems)
+    point_loads = [
+        (gate_config['width_mm'] * 0.8, 2000.0),  # Drive mechanism at 80% length
+        (gate_config['width_mm'] * 0.9, 1000.0),  # Safety systems at 90% length
+    ]
+    
+    # Analyze every section in one vectorized pass (same span and loading)
+    try:
+        batch_results = analyzer.analyze_cantilever_beam_batch(
+            length_mm=gate_config['width_mm'],
+            distributed_load_N_per_mm=governing_load_N_per_mm,
+            point_loads=point_loads,
+            Ix_mm4=sections.Ix_mm4,
+            Sx_mm3=sections.Sx_mm3
+        )
+        safety_mask = batch_results['safety_adequate']
+    except Exception as e:
+        print(f"   ❌ Analysis failed: {e}")
+        sections = sections[:0]
+        safety_mask = np.zeros(0, dtype=bool)
+    
+    # Section weights over the gate span (used for selection and the summary)
+    weights_kg = sections.area_mm2 * (gate_config['width_mm'] * material_props.density_kg_m3 / 1e9)
+    
+    # One pass over the sections collects results, console report lines,
+    # summary table rows and the plots to generate
     analysis_results = []
-    for i, section in enumerate(sections):
-        print(f"\n🔧 Analyzing section {i+1}/{len(sections)}: {section.name}")
+    report_lines = []
+    summary_rows = []
+    plot_tasks = []
+    safe_names = np.char.replace(sections.name, 'x', '_')  # For report file names
+    for i, (section, weight_kg) in enumerate(zip(sections, weights_kg)):
+        result = analyzer.section_result(batch_results, i)
         
-        # Point loads (hardware, operators, safety systems)
-        point_loads = [
-            (gate_config['width_mm'] * 0.8, 2000),  # Drive mechanism at 80% length
-            (gate_config['width_mm'] * 0.9, 1000),  # Safety systems at 90% length
+        # Add section info to results for reporting
+        result['section'] = section
+        result['section_modulus_mm3'] = section.Sx_mm3
+        result['EI_Nm2'] = (analyzer.material.elastic_modulus_Pa * 
+                           section.Ix_mm4 * 1e-12)
+        
+        analysis_results.append(result)
+        
+        # Summary with engineering assessment
+        status = "✅ ADEQUATE" if result['safety_adequate'] else "❌ INADEQUATE"
+        report_lines += [
+            f"\n🔧 Analyzing section {i+1}/{len(sections)}: {section.name}",
+            f"   Max stress: {result['max_stress_Pa']/1e6:.1f} MPa "
+            f"(ratio: {result['stress_ratio']:.2f})",
+            f"   Max deflection: {result['max_deflection_mm']:.1f} mm "
+            f"(ratio: {result['deflection_ratio']:.2f})",
+            f"   Status: {status}",
         ]
         
-        try:
-            # Perform detailed structural analysis
-            result = analyzer.analyze_cantilever_beam(
-                length_mm=gate_config['width_mm'],
-                distributed_load_N_per_mm=governing_load_N_per_mm,
-                point_loads=point_loads,
-                section=section
+        # Engineering warnings
+        if result['stress_ratio'] > 0.8:
+            report_lines.append("   ⚠️  High stress utilization - consider larger section")
+        if result['deflection_ratio'] > 0.8:
+            report_lines.append("   ⚠️  High deflection - may affect operation")
+        
+        status = "ADEQUATE" if result['safety_adequate'] else "INADEQUATE"
+        summary_rows.append(f"{section.name:15} | {weight_kg:10.0f} | {result['stress_ratio']:11.2f} | "
+                            f"{result['deflection_ratio']:15.2f} | {status}")
+        
+        # Individual analysis reports for each adequate section
+        if result['safety_adequate']:
+            plot_tasks.append(
+                (result, section, f"structural_analysis_{safe_names[i]}.png")
             )
-            
-            # Add section info to results for reporting
-            result['section'] = section
-            result['section_modulus_mm3'] = section.Sx_mm3
-            result['EI_Nm2'] = (analyzer.material.elastic_modulus_Pa * 
-                               section.Ix_mm4 * 1e-12)
-            
-            analysis_results.append(result)
-            
-            # Print summary with engineering assessment
-            status = "✅ ADEQUATE" if result['safety_adequate'] else "❌ INADEQUATE"
-            print(f"   Max stress: {result['max_stress_Pa']/1e6:.1f} MPa "
-                  f"(ratio: {result['stress_ratio']:.2f})")
-            print(f"   Max deflection: {result['max_deflection_mm']:.1f} mm "
-                  f"(ratio: {result['deflection_ratio']:.2f})")
-            print(f"   Status: {status}")
-            
-            # Engineering warnings
-            if result['stress_ratio'] > 0.8:
-                print(f"   ⚠️  High stress utilization - consider larger section")
-            if result['deflection_ratio'] > 0.8:
-                print(f"   ⚠️  High deflection - may affect operation")
-                
-        except Exception as e:
-            print(f"   ❌ Analysis failed: {e}")
-            continue
+    
+    if report_lines:
+        print("\n".join(report_lines))
     
     # Create output directory with timestamp
-    output_dir = f"output/enhanced_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    analysis_time = datetime.now()
+    output_dir = os.path.join("output", f"enhanced_analysis_{analysis_time:%Y%m%d_%H%M%S}")
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate advanced visualizations
     print(f"\n📊 Generating advanced visualizations...")
+    # Plotting and Excel support are imported only when reports are generated
+    from src.visualization.engineering_plots import EngineeringPlotter
     plotter = EngineeringPlotter()
     
-    # Individual analysis reports for each adequate section
-    for i, (section, result) in enumerate(zip(sections, analysis_results)):
-        if result['safety_adequate']:
-            report_path = os.path.join(output_dir, 
-                                     f"structural_analysis_{section.name.replace('x', '_')}.png")
-            plotter.create_structural_analysis_report(
-                result, section, gate_config['width_mm'], report_path
-            )
-            print(f"   📈 Created analysis report: {report_path}")
+    # Analysis reports are independent and CPU-bound, so render them in
+    # separate processes
+    report_tasks = [
+        (result, section, gate_config['width_mm'], os.path.join(output_dir, file_name))
+        for result, section, file_name in plot_tasks
+    ]
+    if report_tasks:
+        with ProcessPoolExecutor(max_workers=min(len(report_tasks), os.cpu_count() or 1)) as executor:
+            for report_path in executor.map(_plot_analysis_report, report_tasks):
+                print(f"   📈 Created analysis report: {report_path}")
     
     # Material comparison plot
     if analysis_results:
@@ -250,21 +349,19 @@ def run_enhanced_demo():
     
     # Generate comprehensive Excel reports
     print(f"\n📋 Generating comprehensive Excel reports...")
+    from src.reports.excel_generator import ExcelReportGenerator
     excel_generator = ExcelReportGenerator()
     
     # Find optimal section (minimum weight that meets requirements)
     optimal_section = None
     optimal_result = None
-    min_weight_kg = float('inf')
     
-    for section, result in zip(sections, analysis_results):
-        if result['safety_adequate']:
-            weight_kg = (section.area_mm2 * gate_config['width_mm'] * 
-                        material_props.density_kg_m3 / 1e9)
-            if weight_kg < min_weight_kg:
-                min_weight_kg = weight_kg
-                optimal_section = section
-                optimal_result = result
+    adequate_idx = np.flatnonzero(safety_mask)
+    if adequate_idx.size:
+        optimal_index = adequate_idx[np.argmin(weights_kg[adequate_idx])]
+        optimal_section = sections[optimal_index]
+        optimal_result = analysis_results[optimal_index]
+        min_weight_kg = weights_kg[optimal_index]
     
     if optimal_section:
         print(f"   🎯 Optimal section: {optimal_section.name}")
@@ -301,48 +398,50 @@ def run_enhanced_demo():
     
     # Generate engineering summary report
     summary_path = os.path.join(output_dir, "engineering_summary.txt")
+    summary_lines = [
+        "CANTILEVER SLIDE GATE DESIGN SUMMARY",
+        "=" * 50,
+        "",
+        f"Project: {gate_config['project_name']}",
+        f"Gate Size: {gate_config['width_mm']/1000:.1f}m × {gate_config['height_mm']/1000:.1f}m",
+        f"Design Wind Speed: {gate_config['wind_speed_ms']:g} m/s",
+        f"Material Grade: {material_props.grade}",
+        f"Safety Factor: {gate_config['safety_factor']:.1f}",
+        f"Analysis Date: {analysis_time:%Y-%m-%d %H:%M:%S}",
+        "",
+        "LOAD ANALYSIS:",
+        "-" * 15,
+        f"Wind Pressure: {wind_pressure_Pa:.0f} Pa",
+        f"Governing Load Combination: {governing_combination}",
+        f"Governing Load: {governing_load_N_per_mm:.2f} N/mm",
+        "",
+        "SECTION COMPARISON:",
+        "-" * 20,
+        "Section          | Weight (kg) | Stress Ratio | Deflection Ratio | Status",
+        "-" * 75,
+        *summary_rows,
+    ]
+    
+    if optimal_section:
+        summary_lines += [
+            "",
+            f"RECOMMENDED SECTION: {optimal_section.name}",
+            f"Total Weight: {min_weight_kg:.0f} kg",
+            f"Max Stress: {optimal_result['max_stress_Pa']/1e6:.1f} MPa",
+            f"Max Deflection: {optimal_result['max_deflection_mm']:.1f} mm",
+            f"Stress Safety Margin: {(1/optimal_result['stress_ratio']-1)*100:.0f}%",
+            f"Deflection Safety Margin: {(1/optimal_result['deflection_ratio']-1)*100:.0f}%",
+        ]
+    
     with open(summary_path, 'w') as f:
-        f.write("CANTILEVER SLIDE GATE DESIGN SUMMARY\n")
-        f.write("=" * 50 + "\n\n")
-        f.write(f"Project: {gate_config['project_name']}\n")
-        f.write(f"Gate Size: {gate_config['width_mm']/1000:.1f}m × {gate_config['height_mm']/1000:.1f}m\n")
-        f.write(f"Design Wind Speed: {gate_config['wind_speed_ms']} m/s\n")
-        f.write(f"Material Grade: {material_props.grade}\n")
-        f.write(f"Safety Factor: {gate_config['safety_factor']:.1f}\n")
-        f.write(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        f.write("LOAD ANALYSIS:\n")
-        f.write("-" * 15 + "\n")
-        f.write(f"Wind Pressure: {wind_pressure_Pa:.0f} Pa\n")
-        f.write(f"Governing Load Combination: {governing_combination}\n")
-        f.write(f"Governing Load: {governing_load_N_per_mm:.2f} N/mm\n\n")
-        
-        f.write("SECTION COMPARISON:\n")
-        f.write("-" * 20 + "\n")
-        f.write("Section          | Weight (kg) | Stress Ratio | Deflection Ratio | Status\n")
-        f.write("-" * 75 + "\n")
-        
-        for section, result in zip(sections, analysis_results):
-            weight_kg = (section.area_mm2 * gate_config['width_mm'] * 
-                        material_props.density_kg_m3 / 1e9)
-            status = "ADEQUATE" if result['safety_adequate'] else "INADEQUATE"
-            f.write(f"{section.name:15} | {weight_kg:10.0f} | {result['stress_ratio']:11.2f} | "
-                   f"{result['deflection_ratio']:15.2f} | {status}\n")
-        
-        if optimal_section:
-            f.write(f"\nRECOMMENDED SECTION: {optimal_section.name}\n")
-            f.write(f"Total Weight: {min_weight_kg:.0f} kg\n")
-            f.write(f"Max Stress: {optimal_result['max_stress_Pa']/1e6:.1f} MPa\n")
-            f.write(f"Max Deflection: {optimal_result['max_deflection_mm']:.1f} mm\n")
-            f.write(f"Stress Safety Margin: {(1/optimal_result['stress_ratio']-1)*100:.0f}%\n")
-            f.write(f"Deflection Safety Margin: {(1/optimal_result['deflection_ratio']-1)*100:.0f}%\n")
+        f.write("\n".join(summary_lines) + "\n")
     
     print(f"   📝 Created engineering summary: {summary_path}")
     
     # Final summary
     print(f"\n🎉 Enhanced Analysis Complete!")
     print(f"📁 Output directory: {output_dir}")
-    print(f"📊 Generated {len([r for r in analysis_results if r['safety_adequate']])} structural analysis reports")
+    print(f"📊 Generated {len(plot_tasks)} structural analysis reports")
     print(f"📈 Created material comparison plots")
     print(f"📋 Generated comprehensive Excel documentation")
     
@@ -9,6 +9,7 @@ and custom specifications.
 
 import sys
 import os
+import logging
 from pathlib import Path
 
 # Add project root to Python path
@@ -64,4 +65,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
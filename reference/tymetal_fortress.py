@@ -3,7 +3,12 @@ Reference design data from Tymetal Fortress cantilever slide gate
 """
 
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping
+
+import numpy as np
+
 from calculations.structural_analysis import GateGeometry
 
 
@@ -19,50 +24,88 @@ class TymetalFortressSpecs:
     features: List[str]
 
 
+# Reference specifications (constants shared by every reference instance)
+_SPECS: Dict[str, TymetalFortressSpecs] = {
+    'fortress_12': TymetalFortressSpecs(
+        model='Fortress 12',
+        width_range_mm=(3600, 12000),  # 12' to 40'
+        height_range_mm=(1800, 3600),  # 6' to 12'
+        frame_section='HSS 6x6x1/4',
+        track_type='Crane Rail 135lb',
+        counterweight_type='Concrete Block',
+        features=[
+            'Galvanized construction',
+            'Adjustable carrier wheels',
+            'Guide wheels',
+            'Weather seals',
+            'Manual override capability'
+        ]
+    ),
+    'fortress_20': TymetalFortressSpecs(
+        model='Fortress 20',
+        width_range_mm=(6000, 20000),  # 20' to 65'
+        height_range_mm=(1800, 4800),  # 6' to 16'
+        frame_section='HSS 8x8x3/8',
+        track_type='Crane Rail 175lb',
+        counterweight_type='Steel Plate with Concrete',
+        features=[
+            'Heavy-duty galvanized construction',
+            'Sealed bearing assemblies',
+            'Adjustable guide system',
+            'Weather protection',
+            'Emergency manual operation'
+        ]
+    )
+}
+
+# Frame section properties by gate width
+_HSS_6X6_PROPS = MappingProxyType({
+    'section_name': 'HSS 6x6x1/4',
+    'area_mm2': 5742,  # Cross-sectional area
+    'moment_of_inertia_mm4': 42.7e6,  # Moment of inertia
+    'section_modulus_mm3': 56.9e3,  # Section modulus
+    'weight_kg_m': 45.1  # Weight per meter
+})
+
+_HSS_8X8_PROPS = MappingProxyType({
+    'section_name': 'HSS 8x8x3/8',
+    'area_mm2': 8516,  # Cross-sectional area
+    'moment_of_inertia_mm4': 105.8e6,  # Moment of inertia
+    'section_modulus_mm3': 105.8e3,  # Section modulus
+    'weight_kg_m': 66.9  # Weight per meter
+})
+
+# Size-graded selection: a gate up to _WIDTH_THRESHOLDS_MM[i] uses
+# _FRAME_SECTIONS[i]; wider gates use the next grade up
+_WIDTH_THRESHOLDS_MM = np.array([12000.0])
+_FRAME_SECTIONS = (_HSS_6X6_PROPS, _HSS_8X8_PROPS)
+
+# The same table as a structured array, for selecting over many widths at once
+FRAME_SECTION_DTYPE = np.dtype([
+    ('section_name', 'U16'),
+    ('area_mm2', 'f8'),
+    ('moment_of_inertia_mm4', 'f8'),
+    ('section_modulus_mm3', 'f8'),
+    ('weight_kg_m', 'f8'),
+])
+_FRAME_SECTION_TABLE = np.array(
+    [tuple(props[name] for name in FRAME_SECTION_DTYPE.names) for props in _FRAME_SECTIONS],
+    dtype=FRAME_SECTION_DTYPE
+)
+
+
 class TymetalFortressReference:
     """Reference design data from Tymetal Fortress gate"""
     
     def __init__(self):
-        self.specifications = self._load_specifications()
-        
-    def _load_specifications(self) -> Dict[str, TymetalFortressSpecs]:
-        """Load Tymetal Fortress specifications"""
-        
-        specs = {
-            'fortress_12': TymetalFortressSpecs(
-                model='Fortress 12',
-                width_range_mm=(3600, 12000),  # 12' to 40'
-                height_range_mm=(1800, 3600),  # 6' to 12'
-                frame_section='HSS 6x6x1/4',
-                track_type='Crane Rail 135lb',
-                counterweight_type='Concrete Block',
-                features=[
-                    'Galvanized construction',
-                    'Adjustable carrier wheels',
-                    'Guide wheels',
-                    'Weather seals',
-                    'Manual override capability'
-                ]
-            ),
-            'fortress_20': TymetalFortressSpecs(
-                model='Fortress 20',
-                width_range_mm=(6000, 20000),  # 20' to 65'
-                height_range_mm=(1800, 4800),  # 6' to 16'
-                frame_section='HSS 8x8x3/8',
-                track_type='Crane Rail 175lb',
-                counterweight_type='Steel Plate with Concrete',
-                features=[
-                    'Heavy-duty galvanized construction',
-                    'Sealed bearing assemblies',
-                    'Adjustable guide system',
-                    'Weather protection',
-                    'Emergency manual operation'
-                ]
-            )
-        }
+        self.specifications = _SPECS
+
+    @classmethod
+    @cache
+    def shared(cls) -> 'TymetalFortressReference':
+        """Process-wide reference instance (the reference data never changes)"""
+        return cls()
         
-        return specs
-    
     def get_reference_geometry(self, width_mm: float = 6000) -> GateGeometry:
         """Get reference geometry for scaling"""
         
@@ -76,27 +119,15 @@ class TymetalFortressReference:
             frame_depth_mm=200  # Standard frame depth
         )
     
-    def get_frame_section_properties(self, gate_width_mm: float) -> Dict[str, str | float]:
-        """Get frame section properties based on gate width"""
+    def get_frame_section_properties(self, gate_width_mm: float) -> Mapping[str, str | float]:
+        """Get frame section properties based on gate width (read-only mapping)"""
+        
+        return _FRAME_SECTIONS[int(np.searchsorted(_WIDTH_THRESHOLDS_MM, gate_width_mm))]
+    
+    def get_frame_section_properties_batch(self, gate_widths_mm: np.ndarray) -> np.ndarray:
+        """Get frame section properties for an array of gate widths (FRAME_SECTION_DTYPE rows)"""
         
-        if gate_width_mm <= 12000:
-            # HSS 6x6x1/4 properties
-            return {
-                'section_name': 'HSS 6x6x1/4',
-                'area_mm2': 5742,  # Cross-sectional area
-                'moment_of_inertia_mm4': 42.7e6,  # Moment of inertia
-                'section_modulus_mm3': 56.9e3,  # Section modulus
-                'weight_kg_m': 45.1  # Weight per meter
-            }
-        else:
-            # HSS 8x8x3/8 properties
-            return {
-                'section_name': 'HSS 8x8x3/8',
-                'area_mm2': 8516,  # Cross-sectional area
-                'moment_of_inertia_mm4': 105.8e6,  # Moment of inertia
-                'section_modulus_mm3': 105.8e3,  # Section modulus
-                'weight_kg_m': 66.9  # Weight per meter
-            }
+        return _FRAME_SECTION_TABLE[np.searchsorted(_WIDTH_THRESHOLDS_MM, gate_widths_mm)]
     
     def get_design_guidelines(self) -> Dict[str, str]:
         """Get design guidelines from Tymetal reference"""
@@ -4,17 +4,14 @@ Updated to use proper material properties system
 """
 
 import numpy as np
-from scipy.optimize import minimize
-from scipy.integrate import quad
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle, FancyBboxPatch
-import pandas as pd
+from scipy.integrate import cumulative_trapezoid
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from ..core.materials import SteelGrade, get_material_properties, get_material_properties_by_name
+from functools import cache, lru_cache
+from ..core.materials import get_material_properties_by_name
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BeamSection:
     """Structural beam section properties per AISC standards"""
 
@@ -39,6 +36,302 @@ class BeamSection:
         if self.thickness_mm <= 0:
             raise ValueError(f"Invalid wall thickness: {self.thickness_mm} mm")
 
+    @classmethod
+    def from_record(cls, record: np.void) -> "BeamSection":
+        """Create a section from one row of a SECTION_DTYPE structured array"""
+        return cls(**{name: record[name].item() for name in SECTION_DTYPE.names})
+
+
+# Structured record layout for tables of beam sections (fields of BeamSection)
+SECTION_DTYPE = np.dtype(
+    [
+        ("name", "U32"),
+        ("depth_mm", "f8"),
+        ("width_mm", "f8"),
+        ("thickness_mm", "f8"),
+        ("area_mm2", "f8"),
+        ("Ix_mm4", "f8"),
+        ("Iy_mm4", "f8"),
+        ("Sx_mm3", "f8"),
+        ("Sy_mm3", "f8"),
+        ("rx_mm", "f8"),
+        ("ry_mm", "f8"),
+    ]
+)
+
+
+def _field_view(field: str) -> property:
+    """Read-only property exposing one SECTION_DTYPE column of a SectionArray"""
+    return property(lambda self: self._records[field], doc=f"{field} of every section")
+
+
+class SectionArray:
+    """
+    Table of beam sections stored column-wise in a SECTION_DTYPE array
+
+    Each field (area_mm2, Sx_mm3, ...) is available as a contiguous array view;
+    indexing with an integer or iterating yields BeamSection objects.
+    """
+
+    name = _field_view("name")
+    depth_mm = _field_view("depth_mm")
+    width_mm = _field_view("width_mm")
+    thickness_mm = _field_view("thickness_mm")
+    area_mm2 = _field_view("area_mm2")
+    Ix_mm4 = _field_view("Ix_mm4")
+    Iy_mm4 = _field_view("Iy_mm4")
+    Sx_mm3 = _field_view("Sx_mm3")
+    Sy_mm3 = _field_view("Sy_mm3")
+    rx_mm = _field_view("rx_mm")
+    ry_mm = _field_view("ry_mm")
+
+    def __init__(self, records: np.ndarray):
+        """
+        Args:
+            records: SECTION_DTYPE structured array, one row per section
+        """
+        self._records = np.asarray(records, dtype=SECTION_DTYPE)
+
+    @classmethod
+    def from_sections(cls, sections: List[BeamSection]) -> "SectionArray":
+        """Build a table from BeamSection objects"""
+        records = np.array(
+            [tuple(getattr(s, field) for field in SECTION_DTYPE.names) for s in sections],
+            dtype=SECTION_DTYPE,
+        )
+        return cls(records)
+
+    @property
+    def records(self) -> np.ndarray:
+        """Underlying structured array"""
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return BeamSection.from_record(self._records[index])
+        return SectionArray(self._records[index])
+
+    def __iter__(self):
+        for record in self._records:
+            yield BeamSection.from_record(record)
+
+
+# Batch analysis result entries that hold one value (or profile) per section
+PER_SECTION_RESULT_KEYS = frozenset(
+    {
+        'deflections_mm',
+        'max_stress_Pa',
+        'max_deflection_mm',
+        'stress_ratio',
+        'deflection_ratio',
+        'safety_adequate',
+    }
+)
+
+
+@dataclass(frozen=True)
+class PointLoads:
+    """Point loads on a beam, stored as parallel position and load arrays"""
+
+    positions_mm: np.ndarray  # Distance from the fixed end
+    loads_N: np.ndarray  # Downward load (non-negative)
+
+    @classmethod
+    def from_tuples(cls, point_loads: List[Tuple[float, float]]) -> "PointLoads":
+        """Build from a list of (position_mm, load_N) tuples"""
+        if not point_loads:
+            return cls(np.empty(0), np.empty(0))
+        positions, loads = np.asarray(point_loads, dtype=np.float64).T
+        return cls(positions, loads)
+
+    @classmethod
+    def coerce(cls, point_loads: "PointLoadsLike") -> "PointLoads":
+        """Return point_loads as PointLoads, converting a tuple list if needed"""
+        if isinstance(point_loads, cls):
+            return point_loads
+        return cls.from_tuples(point_loads)
+
+    def __len__(self) -> int:
+        return len(self.positions_mm)
+
+    def validate(self, length_mm: float) -> None:
+        """Raise ValueError for the first load off the beam or negative"""
+        off_beam = (self.positions_mm < 0) | (self.positions_mm > length_mm)
+        negative = self.loads_N < 0
+        invalid = np.flatnonzero(off_beam | negative)
+        if invalid.size == 0:
+            return
+
+        i = invalid[0]
+        if off_beam[i]:
+            raise ValueError(
+                f"Point load position {self.positions_mm[i]} mm outside beam length {length_mm} mm"
+            )
+        raise ValueError(f"Invalid point load: {self.loads_N[i]} N (negative loads not supported)")
+
+
+# Point loads as accepted by the analyzer: PointLoads or (position_mm, load_N) tuples
+PointLoadsLike = List[Tuple[float, float]] | PointLoads
+
+
+def _moment_kernel(
+    x: np.ndarray,
+    length_mm: float,
+    distributed_load_N_per_mm: float,
+    load_positions: np.ndarray,
+    load_values: np.ndarray,
+) -> np.ndarray:
+    """
+    Cantilever bending moment at each station (fixed end at x = 0)
+
+    Args:
+        x: Station positions in mm
+        length_mm: Beam length in mm
+        distributed_load_N_per_mm: Distributed load in N/mm
+        load_positions: Point load positions in mm
+        load_values: Point loads in N
+
+    Returns:
+        Bending moment in N⋅mm at each station
+    """
+    # Moment from distributed load (cantilever: M = wL²/2 at fixed end)
+    moments = np.subtract(length_mm, x)
+    moments *= moments
+    moments *= distributed_load_N_per_mm / 2
+
+    # Moment from point loads (only loads beyond the current position): the
+    # arm clipped at zero drops the other loads without a branch or mask
+    moment_arms = np.maximum(load_positions[np.newaxis, :] - x[:, np.newaxis], 0.0)
+    moments += moment_arms @ load_values
+
+    return moments
+
+
+def _shear_kernel(
+    x: np.ndarray,
+    length_mm: float,
+    distributed_load_N_per_mm: float,
+    load_positions: np.ndarray,
+    load_values: np.ndarray,
+) -> np.ndarray:
+    """
+    Cantilever shear force at each station (fixed end at x = 0)
+
+    Args:
+        x: Station positions in mm
+        length_mm: Beam length in mm
+        distributed_load_N_per_mm: Distributed load in N/mm
+        load_positions: Point load positions in mm
+        load_values: Point loads in N
+
+    Returns:
+        Shear force in N at each station
+    """
+    # Shear from distributed load
+    shears = np.subtract(length_mm, x)
+    shears *= distributed_load_N_per_mm
+
+    # Shear from point loads (only loads beyond the current position): the
+    # comparison acts as a 0/1 indicator in the matrix-vector product
+    beyond = x[:, np.newaxis] <= load_positions[np.newaxis, :]
+    shears += beyond.astype(np.float64) @ load_values
+
+    return shears
+
+
+def _abs_max(values: np.ndarray, axis: Optional[int] = None) -> float | np.ndarray:
+    """Largest absolute value (along axis), without an abs() temporary"""
+    return np.maximum(values.max(axis=axis), -values.min(axis=axis))
+
+
+def _default_station_count(n_point_loads: int) -> int:
+    """Stations for an analysis: the fields are piecewise polynomial, so a few
+    per load segment are enough once every load position is a station"""
+    return max(50, 10 * (n_point_loads + 1))
+
+
+@lru_cache(maxsize=64)
+def _station_grid(
+    length_mm: float, n_stations: int, load_positions: Tuple[float, ...] = ()
+) -> np.ndarray:
+    """
+    Analysis stations along a beam, cached per (length, count, load positions)
+
+    Evenly spaced stations plus every point load position, so the kinks and
+    jumps the loads cause fall exactly on a station. The array is marked
+    read-only because it is shared between calls and returned to callers as
+    part of the analysis results.
+    """
+    x = np.union1d(np.linspace(0, length_mm, n_stations), load_positions)
+    x.flags.writeable = False
+    return x
+
+
+def _double_integrate_from_fixed_end(curvature: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Integrate a curvature profile twice, from the fixed end towards the free end
+
+    Numeric kernel on plain arrays, independent of the analyzer. The
+    cantilever boundary conditions hold at the fixed end (first station):
+    slope and deflection are both zero there.
+
+    Args:
+        curvature: Curvature at each station
+        x: Station positions (increasing, not necessarily evenly spaced)
+
+    Returns:
+        Deflection at each station
+    """
+    # Trapezoidal rule; initial=0 applies y'(0) = y(0) = 0 at the fixed end
+    slope = cumulative_trapezoid(curvature, x=x, initial=0)
+    deflection = cumulative_trapezoid(slope, x=x, initial=0)
+
+    return deflection
+
+
+# ASCE 7 load combinations: factors applied to (dead, live, wind)
+LOAD_COMBINATION_NAMES = (
+    'Service',
+    'Dead + Wind',
+    'LRFD_1',
+    'LRFD_2',
+    'LRFD_3',
+    'LRFD_4',
+    'LRFD_5',
+)
+LOAD_COMBINATION_FACTORS = np.array(
+    [
+        [1.0, 1.0, 0.0],
+        [1.0, 0.0, 1.0],
+        [1.4, 0.0, 0.0],
+        [1.2, 1.6, 0.0],
+        [1.2, 1.0, 1.0],
+        [1.2, 0.0, 1.6],
+        [0.9, 0.0, 1.6],
+    ]
+)
+LOAD_COMBINATION_INDEX = {name: i for i, name in enumerate(LOAD_COMBINATION_NAMES)}
+
+# Load-case batch result entries that hold one value (or profile) per case
+PER_LOAD_CASE_RESULT_KEYS = frozenset(
+    {
+        'distributed_load_N_per_mm',
+        'moments_Nmm',
+        'shears_N',
+        'deflections_mm',
+        'max_moment_Nmm',
+        'max_stress_Pa',
+        'max_deflection_mm',
+        'max_shear_N',
+        'stress_ratio',
+        'deflection_ratio',
+        'safety_adequate',
+    }
+)
+
 
 class AdvancedStructuralAnalyzer:
     """Advanced structural analysis using numerical methods per AISC 360"""
@@ -54,12 +347,24 @@ class AdvancedStructuralAnalyzer:
         self.safety_factor = 2.5  # Per AISC recommendations for cantilever structures
         self.deflection_limit_ratio = 240  # L/240 per AISC
 
+    @classmethod
+    @cache
+    def shared(cls, material_grade: str = 'A572_50') -> 'AdvancedStructuralAnalyzer':
+        """
+        Process-wide analyzer for a steel grade (one instance per grade name)
+
+        The shared instance must not be reconfigured; construct a private
+        analyzer to change the safety factor or deflection limit.
+        """
+        return cls(material_grade)
+
     def analyze_cantilever_beam(
         self,
         length_mm: float,
         distributed_load_N_per_mm: float,
-        point_loads: List[Tuple[float, float]],
+        point_loads: PointLoadsLike,
         section: BeamSection,
+        n_points: Optional[int] = None,
     ) -> Dict:
         """
         Comprehensive cantilever beam analysis per AISC 360
@@ -67,30 +372,67 @@ class AdvancedStructuralAnalyzer:
         Args:
             length_mm: Beam length in mm
             distributed_load_N_per_mm: Distributed load in N/mm
-            point_loads: List of (position_mm, load_N) tuples
+            point_loads: PointLoads or list of (position_mm, load_N) tuples
             section: Beam section properties
+            n_points: Evenly spaced stations (point load positions are added);
+                defaults to a count scaled to the number of point loads
 
         Returns:
             Dict with complete analysis results including safety checks
         """
+        batch = self.analyze_cantilever_beam_batch(
+            length_mm,
+            distributed_load_N_per_mm,
+            point_loads,
+            Ix_mm4=np.array([section.Ix_mm4]),
+            Sx_mm3=np.array([section.Sx_mm3]),
+            n_points=n_points,
+        )
+        return self.section_result(batch, 0)
 
-        # Input validation
-        if length_mm <= 0:
-            raise ValueError(f"Invalid beam length: {length_mm} mm")
-        if distributed_load_N_per_mm < 0:
-            raise ValueError(f"Invalid distributed load: {distributed_load_N_per_mm} N/mm")
+    def analyze_cantilever_beam_batch(
+        self,
+        length_mm: float,
+        distributed_load_N_per_mm: float,
+        point_loads: PointLoadsLike,
+        Ix_mm4: np.ndarray,
+        Sx_mm3: np.ndarray,
+        n_points: Optional[int] = None,
+    ) -> Dict:
+        """
+        Cantilever beam analysis for many sections under the same loading
+
+        The moment and shear diagrams do not depend on the section, so they are
+        computed once; stresses and deflections are broadcast over the sections.
 
-        # Validate point loads
-        for pos, load in point_loads:
-            if pos < 0 or pos > length_mm:
-                raise ValueError(f"Point load position {pos} mm outside beam length {length_mm} mm")
-            if load < 0:
-                raise ValueError(f"Invalid point load: {load} N (negative loads not supported)")
+        Args:
+            length_mm: Beam length in mm
+            distributed_load_N_per_mm: Distributed load in N/mm
+            point_loads: PointLoads or list of (position_mm, load_N) tuples
+            Ix_mm4: Strong-axis moments of inertia, one per section
+            Sx_mm3: Strong-axis section moduli, one per section
+            n_points: Evenly spaced stations (point load positions are added);
+                defaults to a count scaled to the number of point loads
 
-        # Create position array for analysis (1000 points for accuracy)
-        x = np.linspace(0, length_mm, 1000)
+        Returns:
+            Dict of analysis results; entries named in PER_SECTION_RESULT_KEYS
+            have one leading row per section, the rest are shared
+        """
+        point_loads = PointLoads.coerce(point_loads)
+        self._validate_loads(length_mm, distributed_load_N_per_mm, point_loads)
+
+        Ix_mm4 = np.asarray(Ix_mm4, dtype=np.float64)
+        Sx_mm3 = np.asarray(Sx_mm3, dtype=np.float64)
+
+        # Position array for analysis, including every point load position
+        # (shared read-only)
+        if n_points is None:
+            n_points = _default_station_count(len(point_loads))
+        x = _station_grid(
+            float(length_mm), n_points, tuple(np.sort(point_loads.positions_mm).tolist())
+        )
 
-        # Calculate internal forces and moments
+        # Calculate internal forces and moments (shared by all sections)
         moments_Nmm = self._calculate_moment_distribution(
             x, length_mm, distributed_load_N_per_mm, point_loads
         )
@@ -99,29 +441,31 @@ class AdvancedStructuralAnalyzer:
             x, length_mm, distributed_load_N_per_mm, point_loads
         )
 
-        # Calculate deflection using numerical integration
-        deflections_mm = self._calculate_deflection_distribution(
-            x, moments_Nmm, section.Ix_mm4
-        )
+        # Deflection is inversely proportional to Ix: integrate once for a unit
+        # moment of inertia and scale per section (one reciprocal per section,
+        # then multiplies across the stations)
+        unit_deflections_mm = self._calculate_deflection_distribution(x, moments_Nmm, 1.0)
+        inv_Ix_mm4 = 1.0 / Ix_mm4
+        deflections_mm = unit_deflections_mm * inv_Ix_mm4[:, np.newaxis]
 
         # Calculate maximum stresses per AISC 360
-        max_moment_Nmm = np.max(np.abs(moments_Nmm))
-        max_stress_Pa = max_moment_Nmm / section.Sx_mm3 * 1000  # Convert mm³ to m³
+        max_moment_Nmm = _abs_max(moments_Nmm)
+        max_stress_Pa = max_moment_Nmm / Sx_mm3 * 1000  # Convert mm³ to m³
 
         # Safety checks per AISC 360
         allowable_stress_Pa = self.material.yield_strength_Pa / self.safety_factor
         stress_ratio = max_stress_Pa / allowable_stress_Pa
 
         # Deflection checks per AISC
-        max_deflection_mm = np.max(np.abs(deflections_mm))
+        max_deflection_mm = _abs_max(unit_deflections_mm) * inv_Ix_mm4
         deflection_limit_mm = length_mm / self.deflection_limit_ratio
         deflection_ratio = max_deflection_mm / deflection_limit_mm
 
         # Overall safety assessment
-        safety_adequate = stress_ratio <= 1.0 and deflection_ratio <= 1.0
+        safety_adequate = (stress_ratio <= 1.0) & (deflection_ratio <= 1.0)
 
         # Calculate additional engineering parameters
-        max_shear_N = np.max(np.abs(shears_N))
+        max_shear_N = _abs_max(shears_N)
 
         return {
             'positions_mm': x,
@@ -144,83 +488,287 @@ class AdvancedStructuralAnalyzer:
             'elastic_modulus_Pa': self.material.elastic_modulus_Pa
         }
 
+    def analyze_cantilever_beam_fast(
+        self,
+        length_mm: float,
+        distributed_load_N_per_mm: float,
+        point_loads: PointLoadsLike,
+        section: BeamSection,
+    ) -> Dict:
+        """
+        Closed-form cantilever check returning only the governing values
+
+        Uses the fixed-end moment and shear and the textbook tip deflection
+        (wL⁴/8EI + Pa²(3L - a)/6EI per point load) instead of sampling the
+        beam, so no station arrays are built. Use analyze_cantilever_beam when
+        the moment, shear and deflection diagrams are needed.
+
+        Args:
+            length_mm: Beam length in mm
+            distributed_load_N_per_mm: Distributed load in N/mm
+            point_loads: PointLoads or list of (position_mm, load_N) tuples
+            section: Beam section properties
+
+        Returns:
+            Dict with the maximum values, utilization ratios and safety check
+        """
+        batch = self.analyze_cantilever_beam_fast_batch(
+            length_mm,
+            distributed_load_N_per_mm,
+            point_loads,
+            Ix_mm4=np.array([section.Ix_mm4]),
+            Sx_mm3=np.array([section.Sx_mm3]),
+        )
+        return self.section_result(batch, 0)
+
+    def analyze_cantilever_beam_fast_batch(
+        self,
+        length_mm: float,
+        distributed_load_N_per_mm: float,
+        point_loads: PointLoadsLike,
+        Ix_mm4: np.ndarray,
+        Sx_mm3: np.ndarray,
+    ) -> Dict:
+        """
+        Closed-form cantilever check for many sections under the same loading
+
+        Args:
+            length_mm: Beam length in mm
+            distributed_load_N_per_mm: Distributed load in N/mm
+            point_loads: PointLoads or list of (position_mm, load_N) tuples
+            Ix_mm4: Strong-axis moments of inertia, one per section
+            Sx_mm3: Strong-axis section moduli, one per section
+
+        Returns:
+            Dict of governing values; entries named in PER_SECTION_RESULT_KEYS
+            hold one value per section, the rest are shared
+        """
+        point_loads = PointLoads.coerce(point_loads)
+        self._validate_loads(length_mm, distributed_load_N_per_mm, point_loads)
+
+        Ix_mm4 = np.asarray(Ix_mm4, dtype=np.float64)
+        Sx_mm3 = np.asarray(Sx_mm3, dtype=np.float64)
+
+        w = distributed_load_N_per_mm
+        L = length_mm
+        load_positions, load_values = point_loads.positions_mm, point_loads.loads_N
+
+        # Same unit handling as _calculate_deflection_distribution
+        EI = self.material.elastic_modulus_Pa * Ix_mm4 * 1e-3
+
+        max_moment_Nmm = w * L**2 / 2 + float(np.dot(load_values, load_positions))
+        max_shear_N = w * L + float(load_values.sum())
+
+        # Tip deflection times EI is the same for every section
+        deflection_EI = (
+            w * L**4 / 8
+            + float(np.sum(load_values * load_positions**2 * (3 * L - load_positions))) / 6
+        )
+        max_deflection_mm = deflection_EI / EI
+
+        max_stress_Pa = max_moment_Nmm / Sx_mm3 * 1000  # Convert mm³ to m³
+        allowable_stress_Pa = self.material.yield_strength_Pa / self.safety_factor
+        stress_ratio = max_stress_Pa / allowable_stress_Pa
+
+        deflection_limit_mm = length_mm / self.deflection_limit_ratio
+        deflection_ratio = max_deflection_mm / deflection_limit_mm
+
+        return {
+            'max_moment_Nmm': max_moment_Nmm,
+            'max_stress_Pa': max_stress_Pa,
+            'max_deflection_mm': max_deflection_mm,
+            'max_shear_N': max_shear_N,
+            'stress_ratio': stress_ratio,
+            'deflection_ratio': deflection_ratio,
+            'allowable_stress_Pa': allowable_stress_Pa,
+            'deflection_limit_mm': deflection_limit_mm,
+            'safety_adequate': (stress_ratio <= 1.0) & (deflection_ratio <= 1.0),
+        }
+
+    @staticmethod
+    def _validate_loads(
+        length_mm: float,
+        distributed_load_N_per_mm: float,
+        point_loads: PointLoads,
+    ) -> None:
+        """Validate beam length and loads, raising ValueError on bad input"""
+        if length_mm <= 0:
+            raise ValueError(f"Invalid beam length: {length_mm} mm")
+        if distributed_load_N_per_mm < 0:
+            raise ValueError(f"Invalid distributed load: {distributed_load_N_per_mm} N/mm")
+
+        point_loads.validate(length_mm)
+
+    def analyze_cantilever_load_cases(
+        self,
+        length_mm: float,
+        distributed_loads_N_per_mm: np.ndarray,
+        point_loads: PointLoadsLike,
+        section: BeamSection,
+        n_points: Optional[int] = None,
+    ) -> Dict:
+        """
+        Cantilever beam analysis of one section under several distributed loads
+
+        Moment, shear and deflection are linear in the distributed load, so the
+        unit-load and point-load fields are computed once and combined for all
+        cases in one broadcast.
+
+        Args:
+            length_mm: Beam length in mm
+            distributed_loads_N_per_mm: Distributed load of each case in N/mm
+            point_loads: PointLoads or list of (position_mm, load_N) tuples,
+                common to all cases
+            section: Beam section properties
+            n_points: Evenly spaced stations (point load positions are added);
+                defaults to a count scaled to the number of point loads
+
+        Returns:
+            Dict of analysis results; entries named in PER_LOAD_CASE_RESULT_KEYS
+            have one leading row per load case, the rest are shared
+        """
+        w = np.atleast_1d(np.asarray(distributed_loads_N_per_mm, dtype=np.float64))
+        point_loads = PointLoads.coerce(point_loads)
+        self._validate_loads(length_mm, float(w.min()), point_loads)
+
+        if n_points is None:
+            n_points = _default_station_count(len(point_loads))
+        x = _station_grid(
+            float(length_mm), n_points, tuple(np.sort(point_loads.positions_mm).tolist())
+        )
+        no_point_loads = PointLoads.from_tuples([])
+
+        # Fields for a unit distributed load and for the point loads alone
+        unit_moments = self._calculate_moment_distribution(x, length_mm, 1.0, no_point_loads)
+        point_moments = self._calculate_moment_distribution(x, length_mm, 0.0, point_loads)
+        unit_shears = self._calculate_shear_distribution(x, length_mm, 1.0, no_point_loads)
+        point_shears = self._calculate_shear_distribution(x, length_mm, 0.0, point_loads)
+        unit_deflections = self._calculate_deflection_distribution(x, unit_moments, section.Ix_mm4)
+        point_deflections = self._calculate_deflection_distribution(x, point_moments, section.Ix_mm4)
+
+        w_column = w[:, np.newaxis]
+        moments_Nmm = w_column * unit_moments + point_moments
+        shears_N = w_column * unit_shears + point_shears
+        deflections_mm = w_column * unit_deflections + point_deflections
+
+        # Maximum values and checks per AISC 360, one per case
+        max_moment_Nmm = _abs_max(moments_Nmm, axis=1)
+        max_stress_Pa = max_moment_Nmm / section.Sx_mm3 * 1000  # Convert mm³ to m³
+        allowable_stress_Pa = self.material.yield_strength_Pa / self.safety_factor
+        stress_ratio = max_stress_Pa / allowable_stress_Pa
+
+        max_deflection_mm = _abs_max(deflections_mm, axis=1)
+        deflection_limit_mm = length_mm / self.deflection_limit_ratio
+        deflection_ratio = max_deflection_mm / deflection_limit_mm
+
+        return {
+            'distributed_load_N_per_mm': w,
+            'positions_mm': x,
+            'moments_Nmm': moments_Nmm,
+            'shears_N': shears_N,
+            'deflections_mm': deflections_mm,
+            'max_moment_Nmm': max_moment_Nmm,
+            'max_stress_Pa': max_stress_Pa,
+            'max_deflection_mm': max_deflection_mm,
+            'max_shear_N': _abs_max(shears_N, axis=1),
+            'stress_ratio': stress_ratio,
+            'deflection_ratio': deflection_ratio,
+            'allowable_stress_Pa': allowable_stress_Pa,
+            'deflection_limit_mm': deflection_limit_mm,
+            'safety_adequate': (stress_ratio <= 1.0) & (deflection_ratio <= 1.0),
+            'material_grade': self.material.grade,
+            'safety_factor': self.safety_factor,
+            'yield_strength_Pa': self.material.yield_strength_Pa,
+            'ultimate_strength_Pa': self.material.ultimate_strength_Pa,
+            'elastic_modulus_Pa': self.material.elastic_modulus_Pa
+        }
+
+    @staticmethod
+    def load_case_result(batch: Dict, index: int) -> Dict:
+        """
+        Extract the results for one load case from analyze_cantilever_load_cases
+
+        Args:
+            batch: Load-case analysis results
+            index: Load case index within the batch
+
+        Returns:
+            Dict in the analyze_cantilever_beam format (plus the case's
+            distributed_load_N_per_mm)
+        """
+        return {
+            key: value[index] if key in PER_LOAD_CASE_RESULT_KEYS else value
+            for key, value in batch.items()
+        }
+
+    @staticmethod
+    def section_result(batch: Dict, index: int) -> Dict:
+        """
+        Extract the results for one section from analyze_cantilever_beam_batch
+
+        Args:
+            batch: Batch analysis results
+            index: Section index within the batch
+
+        Returns:
+            Dict in the analyze_cantilever_beam format
+        """
+        return {
+            key: value[index] if key in PER_SECTION_RESULT_KEYS else value
+            for key, value in batch.items()
+        }
+
     def _calculate_moment_distribution(
         self,
         x: np.ndarray,
         length_mm: float,
         distributed_load_N_per_mm: float,
-        point_loads: List[Tuple[float, float]],
+        point_loads: PointLoadsLike,
     ) -> np.ndarray:
         """Calculate bending moment distribution for cantilever beam"""
-        moments = np.zeros_like(x)
-
-        for i, pos in enumerate(x):
-            # Moment from distributed load (cantilever: M = wL²/2 at fixed end)
-            if pos > 0:
-                remaining_length = length_mm - pos
-                distributed_moment = distributed_load_N_per_mm * remaining_length**2 / 2
-                moments[i] += distributed_moment
-
-            # Moment from point loads
-            for load_pos, load_N in point_loads:
-                if pos <= load_pos:  # Only consider loads beyond current position
-                    moment_arm = load_pos - pos
-                    moments[i] += load_N * moment_arm
-
-        return moments
+        point_loads = PointLoads.coerce(point_loads)
+        return _moment_kernel(
+            x, length_mm, distributed_load_N_per_mm,
+            point_loads.positions_mm, point_loads.loads_N
+        )
 
     def _calculate_shear_distribution(
         self,
         x: np.ndarray,
         length_mm: float,
         distributed_load_N_per_mm: float,
-        point_loads: List[Tuple[float, float]],
+        point_loads: PointLoadsLike,
     ) -> np.ndarray:
         """Calculate shear force distribution for cantilever beam"""
-        shears = np.zeros_like(x)
-
-        for i, pos in enumerate(x):
-            # Shear from distributed load
-            remaining_length = length_mm - pos
-            distributed_shear = distributed_load_N_per_mm * remaining_length
-            shears[i] += distributed_shear
-
-            # Shear from point loads
-            for load_pos, load_N in point_loads:
-                if pos <= load_pos:  # Only consider loads beyond current position
-                    shears[i] += load_N
-
-        return shears
+        point_loads = PointLoads.coerce(point_loads)
+        return _shear_kernel(
+            x, length_mm, distributed_load_N_per_mm,
+            point_loads.positions_mm, point_loads.loads_N
+        )
 
     def _calculate_deflection_distribution(
         self, x: np.ndarray, moments_Nmm: np.ndarray, Ix_mm4: float
     ) -> np.ndarray:
-        """Calculate deflection using numerical integration of moment-curvature"""
-        E_Pa = self.material.elastic_modulus_Pa
+        """
+        Calculate deflection using numerical integration of moment-curvature
 
-        # Convert units for calculation
-        EI_Nm2 = E_Pa * Ix_mm4 * 1e-12  # Convert mm⁴ to m⁴
+        Curvature is M / (E·I·1e-3) with M in N⋅mm, E in Pa and I in mm⁴
+        (the mm⁴ → m⁴ factor 1e-12 and the 1e9 rescale combined), applied
+        as a single reciprocal multiply.
+        """
+        inv_EI = 1000.0 / (self.material.elastic_modulus_Pa * Ix_mm4)
 
         # Calculate curvature (1/R = M/EI)
-        curvature_per_m = moments_Nmm / (EI_Nm2 * 1e9)  # Convert back to 1/mm units
+        curvature_per_mm = moments_Nmm * inv_EI
 
         # Double integration: curvature -> slope -> deflection
-        dx = x[1] - x[0]  # Position increment
-
-        # First integration: curvature to slope
-        slope = np.zeros_like(x)
-        for i in range(len(x) - 1, 0, -1):  # Integrate from free end to fixed end
-            slope[i-1] = slope[i] + curvature_per_m[i] * dx
-
-        # Second integration: slope to deflection
-        deflection = np.zeros_like(x)
-        for i in range(len(x) - 1, 0, -1):  # Integrate from free end to fixed end
-            deflection[i-1] = deflection[i] + slope[i] * dx
-
-        return deflection
+        return _double_integrate_from_fixed_end(curvature_per_mm, x)
 
     def optimize_beam_section(
-        self, length_mm: float, loads: Dict, available_sections: List[BeamSection]
+        self,
+        length_mm: float,
+        loads: Dict,
+        available_sections: List[BeamSection] | SectionArray,
     ) -> BeamSection:
         """
         Optimize beam section selection using minimum weight approach
@@ -228,40 +776,40 @@ class AdvancedStructuralAnalyzer:
         Args:
             length_mm: Beam length
             loads: Load dictionary with distributed and point loads
-            available_sections: List of available sections
+            available_sections: Available sections (list or SectionArray)
 
         Returns:
             Optimal BeamSection that meets all requirements
         """
-        suitable_sections = []
-
-        # Check each section for adequacy
-        for section in available_sections:
-            try:
-                # Quick analysis
-                result = self.analyze_cantilever_beam(
-                    length_mm=length_mm,
-                    distributed_load_N_per_mm=loads.get('distributed_N_per_mm', 0),
-                    point_loads=loads.get('point_loads', []),
-                    section=section
-                )
-
-                if result['safety_adequate']:
-                    weight_kg = section.area_mm2 * length_mm * self.material.density_kg_m3 / 1e9
-                    suitable_sections.append((section, weight_kg, result))
-
-            except Exception as e:
-                print(f"Warning: Section {section.name} failed analysis: {e}")
-                continue
-
-        if not suitable_sections:
+        if not isinstance(available_sections, SectionArray):
+            available_sections = SectionArray.from_sections(available_sections)
+
+        # Check every section for adequacy in one closed-form pass
+        # (diagrams are not needed here)
+        try:
+            results = self.analyze_cantilever_beam_fast_batch(
+                length_mm=length_mm,
+                distributed_load_N_per_mm=loads.get('distributed_N_per_mm', 0),
+                point_loads=loads.get('point_loads', []),
+                Ix_mm4=available_sections.Ix_mm4,
+                Sx_mm3=available_sections.Sx_mm3,
+            )
+        except Exception as e:
+            print(f"Warning: Section analysis failed: {e}")
+            raise ValueError("No suitable sections found for given loads") from e
+
+        suitable = np.flatnonzero(results['safety_adequate'])
+        if suitable.size == 0:
             raise ValueError("No suitable sections found for given loads")
 
         # Select minimum weight section
-        optimal_section, min_weight, optimal_result = min(suitable_sections, key=lambda x: x[1])
+        weights_kg = available_sections.area_mm2 * (length_mm * self.material.density_kg_m3 / 1e9)
+        optimal_index = suitable[np.argmin(weights_kg[suitable])]
+        optimal_section = available_sections[optimal_index]
+        optimal_result = self.section_result(results, optimal_index)
 
         print(f"Optimal section selected: {optimal_section.name}")
-        print(f"Weight: {min_weight:.1f} kg")
+        print(f"Weight: {weights_kg[optimal_index]:.1f} kg")
         print(f"Stress ratio: {optimal_result['stress_ratio']:.2f}")
         print(f"Deflection ratio: {optimal_result['deflection_ratio']:.2f}")
 
@@ -281,14 +829,34 @@ class AdvancedStructuralAnalyzer:
         Returns:
             Dictionary of load combinations per ASCE 7
         """
-        combinations = {
-            'Service': dead_load_N_per_mm + live_load_N_per_mm,
-            'Dead + Wind': dead_load_N_per_mm + wind_load_N_per_mm,
-            'LRFD_1': 1.4 * dead_load_N_per_mm,
-            'LRFD_2': 1.2 * dead_load_N_per_mm + 1.6 * live_load_N_per_mm,
-            'LRFD_3': 1.2 * dead_load_N_per_mm + 1.0 * live_load_N_per_mm + 1.0 * wind_load_N_per_mm,
-            'LRFD_4': 1.2 * dead_load_N_per_mm + 1.6 * wind_load_N_per_mm,
-            'LRFD_5': 0.9 * dead_load_N_per_mm + 1.6 * wind_load_N_per_mm
-        }
+        combinations, names = self.generate_load_combinations_batch(
+            dead_load_N_per_mm, live_load_N_per_mm, wind_load_N_per_mm
+        )
+
+        return dict(zip(names, combinations.tolist()))
+
+    def generate_load_combinations_batch(
+        self,
+        dead_load_N_per_mm: np.ndarray,
+        live_load_N_per_mm: np.ndarray,
+        wind_load_N_per_mm: np.ndarray,
+    ) -> Tuple[np.ndarray, Tuple[str, ...]]:
+        """
+        Generate ASCE 7 load combinations for arrays of load cases
+
+        Args:
+            dead_load_N_per_mm: Dead loads in N/mm
+            live_load_N_per_mm: Live loads in N/mm
+            wind_load_N_per_mm: Wind loads in N/mm
+
+        Returns:
+            (combinations, names): combinations has one row per name in
+            LOAD_COMBINATION_NAMES and one column per load case; use
+            argmax(axis=0) to find the governing combination of each case and
+            LOAD_COMBINATION_INDEX to look a combination's row up by name
+        """
+        loads = np.stack(
+            np.broadcast_arrays(dead_load_N_per_mm, live_load_N_per_mm, wind_load_N_per_mm)
+        ).astype(np.float64)
 
-        return combinations
+        return LOAD_COMBINATION_FACTORS @ loads, LOAD_COMBINATION_NAMES
@@ -4,9 +4,10 @@ Following ASTM standards and engineering best practices
 """
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SteelProperties:
     """Steel material properties following ASTM standards"""
     grade: str
@@ -100,9 +101,20 @@ def get_material_properties(grade: SteelGrade) -> SteelProperties:
     
     return STEEL_PROPERTIES[grade]
 
+# Grade names accepted by get_material_properties_by_name (common naming variations)
+_GRADE_MAPPING: Dict[str, SteelGrade] = {
+    'A36': SteelGrade.A36,
+    'A572_50': SteelGrade.A572_50,
+    'A572-50': SteelGrade.A572_50,
+    'A572 Grade 50': SteelGrade.A572_50,
+    'A588': SteelGrade.A588,
+    'A992': SteelGrade.A992
+}
+
+@lru_cache(maxsize=None)
 def get_material_properties_by_name(grade_name: str) -> SteelProperties:
     """
-    Get material properties by grade name string
+    Get material properties by grade name string (cached per name)
     
     Args:
         grade_name: Steel grade name (e.g., 'A572_50', 'A36')
@@ -113,21 +125,11 @@ def get_material_properties_by_name(grade_name: str) -> SteelProperties:
     Raises:
         ValueError: If steel grade name is not found
     """
-    # Handle common naming variations
-    grade_mapping = {
-        'A36': SteelGrade.A36,
-        'A572_50': SteelGrade.A572_50,
-        'A572-50': SteelGrade.A572_50,
-        'A572 Grade 50': SteelGrade.A572_50,
-        'A588': SteelGrade.A588,
-        'A992': SteelGrade.A992
-    }
-    
-    if grade_name not in grade_mapping:
-        available_grades = list(grade_mapping.keys())
+    if grade_name not in _GRADE_MAPPING:
+        available_grades = list(_GRADE_MAPPING.keys())
         raise ValueError(f"Unknown steel grade: {grade_name}. Available grades: {available_grades}")
     
-    return get_material_properties(grade_mapping[grade_name])
+    return get_material_properties(_GRADE_MAPPING[grade_name])
 
 def validate_material_selection(grade: SteelGrade, application: str = "general") -> dict:
     """
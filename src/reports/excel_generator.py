@@ -1,18 +1,34 @@
 """
 Professional Excel report generation using openpyxl
+An xlsxwriter-backed generator with the same interface is used when available
 """
 
-from typing import Dict
+from typing import Any, Dict, List
+from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.utils import get_column_letter
+
+try:
+    import xlsxwriter
+except ImportError:  # xlsxwriter is optional
+    xlsxwriter = None
 
 
 class ExcelReportGenerator:
     """Generate professional Excel reports for structural analysis"""
 
     def __init__(self):
-        self.wb = Workbook()
+        # Workbook of the report being written; created per report because a
+        # write-only workbook can only be saved once
+        self.wb = None
+        self._init_styles()
+
+    def _init_styles(self) -> None:
+        """Create the style objects shared by every report"""
         self.title_font = Font(size=16, bold=True, color="FFFFFF")
         self.header_font = Font(size=12, bold=True, color="FFFFFF")
         self.data_font = Font(size=10)
@@ -28,6 +44,17 @@ class ExcelReportGenerator:
             top=Side(style="thin"),
             bottom=Side(style="thin"),
         )
+        # Shared style objects, reused instead of rebuilt per cell
+        self.bold_font = Font(bold=True)
+        self.green_fill = PatternFill(
+            start_color="90EE90", end_color="90EE90", fill_type="solid"
+        )
+        self.red_fill = PatternFill(
+            start_color="FFB6C1", end_color="FFB6C1", fill_type="solid"
+        )
+        self.right_align = Alignment(horizontal="right")
+        self.center_align = Alignment(horizontal="center")
+        self.center_v_align = Alignment(horizontal="center", vertical="center")
 
     def create_comprehensive_report(
         self,
@@ -35,11 +62,22 @@ class ExcelReportGenerator:
         analysis_results: Dict,
         material_data: Dict,
         output_path: str,
+        use_xlsxwriter: bool = False,
     ) -> None:
-        """Create comprehensive Excel report with multiple worksheets"""
+        """
+        Create comprehensive Excel report with multiple worksheets
 
-        # Remove default sheet
-        self.wb.remove(self.wb.active)
+        With use_xlsxwriter the report is written by XlsxWriterReportGenerator
+        (when xlsxwriter is installed), which is faster for the same layout.
+        """
+        if use_xlsxwriter and xlsxwriter is not None:
+            XlsxWriterReportGenerator().create_comprehensive_report(
+                gate_config, analysis_results, material_data, output_path
+            )
+            return
+
+        # Write-only workbooks stream rows to disk and start without a sheet
+        self.wb = Workbook(write_only=True)
 
         # Create worksheets
         self._create_summary_sheet(gate_config, analysis_results)
@@ -51,45 +89,112 @@ class ExcelReportGenerator:
         # Save workbook
         self.wb.save(output_path)
 
-    def _create_summary_sheet(self, gate_config: Dict, analysis_results: Dict) -> None:
-        """Create executive summary worksheet"""
-        ws = self.wb.create_sheet("Executive Summary")
+    def _add_sheet(self, title: str):
+        """Create a worksheet"""
+        return self.wb.create_sheet(title)
+
+    def _sc(
+        self,
+        ws,
+        value=None,
+        *,
+        bold=False,
+        font=None,
+        fill=None,
+        alignment=None,
+        bordered=True,
+        number_format=None,
+    ):
+        """Create a styled cell; cells are bordered unless bordered=False"""
+        return self._cell(
+            ws,
+            value,
+            self.bold_font if bold else font,
+            fill,
+            alignment,
+            self.border if bordered else None,
+            number_format,
+        )
+
+    def _title_cell(self, ws, text: str, bordered: bool = False):
+        """Sheet title cell, merged across the title span by _write_sheet"""
+        return self._sc(
+            ws,
+            text,
+            font=self.title_font,
+            fill=self.title_fill,
+            alignment=self.center_v_align,
+            bordered=bordered,
+        )
+
+    def _header_cell(
+        self, ws, text: str, centered: bool = False, bordered: bool = False
+    ):
+        """Section or table header cell"""
+        return self._sc(
+            ws,
+            text,
+            font=self.header_font,
+            fill=self.header_fill,
+            alignment=self.center_align if centered else None,
+            bordered=bordered,
+        )
 
-        # Title
-        ws.merge_cells("A1:H1")
-        ws["A1"] = "CANTILEVER SLIDE GATE - STRUCTURAL ANALYSIS REPORT"
-        ws["A1"].font = self.title_font
-        ws["A1"].fill = self.title_fill
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
+    @staticmethod
+    def _cell(ws, value, font, fill, alignment, border, number_format):
+        """Create a write-only cell with its style attached"""
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell
+
+    @staticmethod
+    def _column_widths(rows: List[List]) -> Dict[int, float]:
+        """Column widths (by 1-based index) fitted to the longest value"""
+        col_widths = {}
+        for row in rows:
+            for column, cell in enumerate(row, start=1):
+                value = cell.value
+                if value is None:
+                    continue
+                length = len(value if isinstance(value, str) else str(value))
+                if length > col_widths.get(column, 0):
+                    col_widths[column] = length
+        return {column: min(width + 2, 50) for column, width in col_widths.items()}
+
+    def _write_sheet(self, ws, rows: List[List], title_span: str) -> None:
+        """Size the columns, stream the rows and merge the title across title_span"""
+        # Widths must be set before the first row is streamed; the merged
+        # title row is left out of them
+        for column, width in self._column_widths(rows[1:]).items():
+            ws.column_dimensions[get_column_letter(column)].width = width
+        for row in rows:
+            ws.append(row)
+        ws.merged_cells.ranges.add(title_span)
 
-        # Project information
-        ws["A3"] = "PROJECT INFORMATION"
-        ws["A3"].font = self.header_font
-        ws["A3"].fill = self.header_fill
-        ws["A3"].alignment = Alignment(horizontal="center")
+    def _create_summary_sheet(self, gate_config: Dict, analysis_results: Dict) -> None:
+        """Create executive summary worksheet"""
+        ws = self._add_sheet("Executive Summary")
 
         project_data = [
             ["Project Name:", gate_config.get("project_name", "Slide Gate Design")],
             ["Gate Width:", f"{gate_config.get('width_mm', 0) / 1000:.1f} m"],
             ["Gate Height:", f"{gate_config.get('height_mm', 2400) / 1000:.1f} m"],
-            ["Design Wind Speed:", f"{gate_config.get('wind_speed_ms', 35)} m/s"],
+            ["Design Wind Speed:", f"{gate_config.get('wind_speed_ms', 35):g} m/s"],
             ["Analysis Date:", datetime.now().strftime("%Y-%m-%d %H:%M")],
             ["Engineer:", "Structural Analysis Software"],
             ["Material Grade:", gate_config.get("material_grade", "A572 Grade 50")],
             ["Safety Factor:", f"{gate_config.get('safety_factor', 2.5):.1f}"],
         ]
 
-        for i, (label, value) in enumerate(project_data, start=4):
-            ws[f"A{i}"] = label
-            ws[f"B{i}"] = value
-            ws[f"A{i}"].font = Font(bold=True)
-
-        # Analysis results summary
-        ws["A13"] = "ANALYSIS RESULTS SUMMARY"
-        ws["A13"].font = self.header_font
-        ws["A13"].fill = self.header_fill
-        ws["A13"].alignment = Alignment(horizontal="center")
-
         results_data = [
             [
                 "Maximum Bending Moment:",
@@ -124,50 +229,52 @@ class ExcelReportGenerator:
             ],
         ]
 
-        for i, (label, value) in enumerate(results_data, start=14):
-            ws[f"A{i}"] = label
-            ws[f"B{i}"] = value
-            ws[f"A{i}"].font = Font(bold=True)
-
-            # Color code the design status
-            if "Design Status" in label:
-                if "ADEQUATE" in str(value):
-                    ws[f"B{i}"].fill = PatternFill(
-                        start_color="90EE90", end_color="90EE90", fill_type="solid"
-                    )
-                else:
-                    ws[f"B{i}"].fill = PatternFill(
-                        start_color="FFB6C1", end_color="FFB6C1", fill_type="solid"
-                    )
-
-        # Apply borders and formatting
-        for row in ws["A1:B21"]:
-            for cell in row:
-                cell.border = self.border
-
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Title, then blank separator rows; A1:B21 is bordered throughout
+        rows = [
+            [
+                self._title_cell(
+                    ws,
+                    "CANTILEVER SLIDE GATE - STRUCTURAL ANALYSIS REPORT",
+                    bordered=True,
+                ),
+                self._sc(ws),
+            ],
+            [self._sc(ws), self._sc(ws)],
+        ]
+
+        for heading, data in (
+            ("PROJECT INFORMATION", project_data),
+            ("ANALYSIS RESULTS SUMMARY", results_data),
+        ):
+            if len(rows) > 2:
+                rows.append([self._sc(ws), self._sc(ws)])
+            rows.append(
+                [
+                    self._header_cell(ws, heading, centered=True, bordered=True),
+                    self._sc(ws),
+                ]
+            )
+            for label, value in data:
+                fill = None
+                # Color code the design status (exact match: "INADEQUATE"
+                # contains "ADEQUATE")
+                if "Design Status" in label:
+                    fill = self.green_fill if value == "ADEQUATE" else self.red_fill
+                rows.append(
+                    [
+                        self._sc(ws, label, bold=True),
+                        self._sc(ws, value, fill=fill),
+                    ]
+                )
+
+        self._write_sheet(ws, rows, "A1:H1")
 
     def _create_calculations_sheet(self, analysis_results: Dict) -> None:
         """Create detailed calculations worksheet"""
-        ws = self.wb.create_sheet("Detailed Calculations")
+        ws = self._add_sheet("Detailed Calculations")
 
-        # Title
-        ws.merge_cells("A1:F1")
-        ws["A1"] = "DETAILED STRUCTURAL CALCULATIONS"
-        ws["A1"].font = self.title_font
-        ws["A1"].fill = self.title_fill
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
+        title = self._title_cell(ws, "DETAILED STRUCTURAL CALCULATIONS", bordered=True)
+        rows = [[title]]
 
         # Create data table
         if "positions_mm" in analysis_results:
@@ -185,49 +292,58 @@ class ExcelReportGenerator:
                 "Stress (MPa)",
                 "Curvature (1/m)",
             ]
-            for i, header in enumerate(headers, start=1):
-                cell = ws.cell(row=3, column=i, value=header)
-                cell.font = self.header_font
-                cell.fill = self.header_fill
-                cell.alignment = Alignment(horizontal="center")
+            rows[0].extend(self._sc(ws) for _ in headers[1:])
+            rows.append([self._sc(ws) for _ in headers])
+            rows.append(
+                [
+                    self._header_cell(ws, header, centered=True, bordered=True)
+                    for header in headers
+                ]
+            )
 
             # Data rows (sample every 10th point to avoid too much data)
             step = max(1, len(positions) // 100)  # Max 100 data points
-            for i in range(0, len(positions), step):
-                row = i // step + 4
-                ws.cell(row=row, column=1, value=float(positions[i]))
-                ws.cell(row=row, column=2, value=float(moments[i] / 1e6))
-                ws.cell(row=row, column=3, value=float(shears[i] / 1000))
-                ws.cell(row=row, column=4, value=float(deflections[i]))
-                # Calculate stress and curvature
-                if "section_modulus_mm3" in analysis_results:
-                    stress = moments[i] / analysis_results["section_modulus_mm3"]
-                    ws.cell(row=row, column=5, value=float(stress))
-                if "EI_Nm2" in analysis_results:
-                    curvature = (
-                        moments[i] / analysis_results["EI_Nm2"] * 1000
-                    )  # Convert to 1/m
-                    ws.cell(row=row, column=6, value=float(curvature))
-
-        # Apply formatting
-        for row in ws.iter_rows():
-            for cell in row:
-                cell.border = self.border
-                if cell.row > 3:  # Data rows
-                    cell.alignment = Alignment(horizontal="right")
-                    if cell.column > 1:  # Numeric columns
-                        cell.number_format = "0.00"
+            sampled_moments = np.asarray(moments)[::step]
+            # Stress and curvature are left empty (NaN) without their inputs
+            stresses = curvatures = np.full(len(sampled_moments), np.nan)
+            if "section_modulus_mm3" in analysis_results:
+                stresses = sampled_moments / analysis_results["section_modulus_mm3"]
+            if "EI_Nm2" in analysis_results:
+                curvatures = (
+                    sampled_moments / analysis_results["EI_Nm2"] * 1000
+                )  # Convert to 1/m
+
+            table = np.column_stack(
+                [
+                    np.asarray(positions)[::step],
+                    sampled_moments / 1e6,
+                    np.asarray(shears)[::step] / 1000,
+                    np.asarray(deflections)[::step],
+                    stresses,
+                    curvatures,
+                ]
+            ).tolist()
+
+            # Numeric columns are shown to two decimals
+            number_formats = [None] + ["0.00"] * (len(headers) - 1)
+            for values in table:
+                rows.append(
+                    [
+                        self._sc(
+                            ws,
+                            None if value != value else value,  # NaN -> empty
+                            alignment=self.right_align,
+                            number_format=number_format,
+                        )
+                        for value, number_format in zip(values, number_formats)
+                    ]
+                )
+
+        self._write_sheet(ws, rows, "A1:F1")
 
     def _create_material_sheet(self, material_data: Dict) -> None:
         """Create material properties worksheet"""
-        ws = self.wb.create_sheet("Material Properties")
-
-        # Title
-        ws.merge_cells("A1:D1")
-        ws["A1"] = "MATERIAL PROPERTIES AND SPECIFICATIONS"
-        ws["A1"].font = self.title_font
-        ws["A1"].fill = self.title_fill
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
+        ws = self._add_sheet("Material Properties")
 
         # Material properties table
         properties = [
@@ -276,19 +392,22 @@ class ExcelReportGenerator:
             ],
         ]
 
-        for i, row_data in enumerate(properties, start=3):
-            for j, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=i, column=j, value=value)
-                if i == 3:  # Header row
-                    cell.font = self.header_font
-                    cell.fill = self.header_fill
-                    cell.alignment = Alignment(horizontal="center")
-                cell.border = self.border
+        rows = [
+            [self._title_cell(ws, "MATERIAL PROPERTIES AND SPECIFICATIONS")],
+            [],
+            [
+                self._header_cell(ws, value, centered=True, bordered=True)
+                for value in properties[0]
+            ],
+        ]
+        rows.extend(
+            [self._sc(ws, value) for value in row_data]
+            for row_data in properties[1:]
+        )
 
         # Section properties
-        ws["A12"] = "SECTION PROPERTIES"
-        ws["A12"].font = self.header_font
-        ws["A12"].fill = self.header_fill
+        rows.append([])
+        rows.append([self._header_cell(ws, "SECTION PROPERTIES")])
 
         if "section" in material_data:
             section = material_data["section"]
@@ -303,105 +422,68 @@ class ExcelReportGenerator:
                 ["Radius of Gyration (ry)", f"{section.get('ry_mm', 0):.1f}", "mm"],
             ]
 
-            for i, (prop, value, unit) in enumerate(section_props, start=13):
-                ws[f"A{i}"] = prop
-                ws[f"B{i}"] = value
-                ws[f"C{i}"] = unit
-                ws[f"A{i}"].font = Font(bold=True)
-                for col in ["A", "B", "C"]:
-                    ws[f"{col}{i}"].border = self.border
+            rows.extend(
+                [
+                    self._sc(ws, prop, bold=True),
+                    self._sc(ws, value),
+                    self._sc(ws, unit),
+                ]
+                for prop, value, unit in section_props
+            )
+
+        self._write_sheet(ws, rows, "A1:D1")
 
     def _create_loading_sheet(self, gate_config: Dict) -> None:
         """Create loading conditions worksheet"""
-        ws = self.wb.create_sheet("Loading Conditions")
-
-        # Title
-        ws.merge_cells("A1:E1")
-        ws["A1"] = "LOADING CONDITIONS AND LOAD COMBINATIONS"
-        ws["A1"].font = self.title_font
-        ws["A1"].fill = self.title_fill
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
+        ws = self._add_sheet("Loading Conditions")
 
-        # Wind loading
-        ws["A3"] = "WIND LOADING"
-        ws["A3"].font = self.header_font
-        ws["A3"].fill = self.header_fill
+        # Derived loads, computed once
+        wind_speed_ms = gate_config.get("wind_speed_ms", 35)
+        width_mm = gate_config.get("width_mm", 6000)
+        height_mm = gate_config.get("height_mm", 2400)
+        gate_weight_kg = gate_config.get("gate_weight_kg", 500)
+        wind_pressure_Pa = 0.5 * 1.225 * wind_speed_ms**2
+        effective_pressure_Pa = wind_pressure_Pa * 1.2
+        gate_weight_N = gate_weight_kg * 9.81
 
         wind_data = [
-            ["Design Wind Speed", f"{gate_config.get('wind_speed_ms', 35)}", "m/s"],
-            [
-                "Wind Pressure (q)",
-                f"{0.5 * 1.225 * gate_config.get('wind_speed_ms', 35) ** 2:.1f}",
-                "Pa",
-            ],
+            ["Design Wind Speed", f"{wind_speed_ms}", "m/s"],
+            ["Wind Pressure (q)", f"{wind_pressure_Pa:.1f}", "Pa"],
             ["Wind Pressure Coefficient", "1.2", "-"],
-            [
-                "Effective Wind Pressure",
-                f"{0.5 * 1.225 * gate_config.get('wind_speed_ms', 35) ** 2 * 1.2:.1f}",
-                "Pa",
-            ],
-            [
-                "Gate Area",
-                f"{gate_config.get('width_mm', 6000) * gate_config.get('height_mm', 2400) / 1e6:.1f}",
-                "m²",
-            ],
+            ["Effective Wind Pressure", f"{effective_pressure_Pa:.1f}", "Pa"],
+            ["Gate Area", f"{width_mm * height_mm / 1e6:.1f}", "m²"],
             [
                 "Total Wind Force",
-                f"{0.5 * 1.225 * gate_config.get('wind_speed_ms', 35) ** 2 * 1.2 * gate_config.get('width_mm', 6000) * gate_config.get('height_mm', 2400) / 1e6 / 1000:.1f}",
+                f"{effective_pressure_Pa * width_mm * height_mm / 1e6 / 1000:.1f}",
                 "kN",
             ],
         ]
 
-        for i, (item, value, unit) in enumerate(wind_data, start=4):
-            ws[f"A{i}"] = item
-            ws[f"B{i}"] = value
-            ws[f"C{i}"] = unit
-            ws[f"A{i}"].font = Font(bold=True)
-            for col in ["A", "B", "C"]:
-                ws[f"{col}{i}"].border = self.border
-
-        # Dead loads
-        ws["A11"] = "DEAD LOADS"
-        ws["A11"].font = self.header_font
-        ws["A11"].fill = self.header_fill
-
         dead_loads = [
-            ["Gate Self Weight", f"{gate_config.get('gate_weight_kg', 500):.0f}", "kg"],
-            [
-                "Gate Self Weight Force",
-                f"{gate_config.get('gate_weight_kg', 500) * 9.81 / 1000:.1f}",
-                "kN",
-            ],
-            [
-                "Distributed Dead Load",
-                f"{gate_config.get('gate_weight_kg', 500) * 9.81 / gate_config.get('width_mm', 6000):.2f}",
-                "N/mm",
-            ],
+            ["Gate Self Weight", f"{gate_weight_kg:.0f}", "kg"],
+            ["Gate Self Weight Force", f"{gate_weight_N / 1000:.1f}", "kN"],
+            ["Distributed Dead Load", f"{gate_weight_N / width_mm:.2f}", "N/mm"],
         ]
 
-        for i, (item, value, unit) in enumerate(dead_loads, start=12):
-            ws[f"A{i}"] = item
-            ws[f"B{i}"] = value
-            ws[f"C{i}"] = unit
-            ws[f"A{i}"].font = Font(bold=True)
-            for col in ["A", "B", "C"]:
-                ws[f"{col}{i}"].border = self.border
+        rows = [[self._title_cell(ws, "LOADING CONDITIONS AND LOAD COMBINATIONS")]]
 
-    def _create_design_criteria_sheet(self) -> None:
-        """Create design criteria and code references worksheet"""
-        ws = self.wb.create_sheet("Design Criteria")
+        for heading, data in (("WIND LOADING", wind_data), ("DEAD LOADS", dead_loads)):
+            rows.append([])
+            rows.append([self._header_cell(ws, heading)])
+            rows.extend(
+                [
+                    self._sc(ws, item, bold=True),
+                    self._sc(ws, value),
+                    self._sc(ws, unit),
+                ]
+                for item, value, unit in data
+            )
 
-        # Title
-        ws.merge_cells("A1:D1")
-        ws["A1"] = "DESIGN CRITERIA AND CODE REFERENCES"
-        ws["A1"].font = self.title_font
-        ws["A1"].fill = self.title_fill
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
+        self._write_sheet(ws, rows, "A1:E1")
 
-        # Design codes
-        ws["A3"] = "APPLICABLE CODES AND STANDARDS"
-        ws["A3"].font = self.header_font
-        ws["A3"].fill = self.header_fill
+    def _create_design_criteria_sheet(self) -> None:
+        """Create design criteria and code references worksheet"""
+        ws = self._add_sheet("Design Criteria")
 
         codes = [
             ["AISC 360", "Specification for Structural Steel Buildings"],
@@ -414,18 +496,6 @@ class ExcelReportGenerator:
             ],
         ]
 
-        for i, (code, description) in enumerate(codes, start=4):
-            ws[f"A{i}"] = code
-            ws[f"B{i}"] = description
-            ws[f"A{i}"].font = Font(bold=True)
-            for col in ["A", "B"]:
-                ws[f"{col}{i}"].border = self.border
-
-        # Design criteria
-        ws["A10"] = "DESIGN CRITERIA"
-        ws["A10"].font = self.header_font
-        ws["A10"].fill = self.header_fill
-
         criteria = [
             ["Safety Factor", "2.5", "Applied to yield strength"],
             ["Deflection Limit", "L/240", "Maximum allowable deflection"],
@@ -435,10 +505,113 @@ class ExcelReportGenerator:
             ["Fatigue Considerations", "Infinite Life", "Gate operation cycles"],
         ]
 
-        for i, (criterion, value, note) in enumerate(criteria, start=11):
-            ws[f"A{i}"] = criterion
-            ws[f"B{i}"] = value
-            ws[f"C{i}"] = note
-            ws[f"A{i}"].font = Font(bold=True)
-            for col in ["A", "B", "C"]:
-                ws[f"{col}{i}"].border = self.border
+        rows = [[self._title_cell(ws, "DESIGN CRITERIA AND CODE REFERENCES")]]
+
+        # Design codes, then design criteria
+        for heading, data in (
+            ("APPLICABLE CODES AND STANDARDS", codes),
+            ("DESIGN CRITERIA", criteria),
+        ):
+            rows.append([])
+            rows.append([self._header_cell(ws, heading)])
+            rows.extend(
+                [self._sc(ws, entry[0], bold=True)]
+                + [self._sc(ws, value) for value in entry[1:]]
+                for entry in data
+            )
+
+        self._write_sheet(ws, rows, "A1:D1")
+
+
+@dataclass(frozen=True, slots=True)
+class _XlsxCell:
+    """Cell value with its xlsxwriter format"""
+
+    value: Any
+    format: Any
+
+
+class XlsxWriterReportGenerator(ExcelReportGenerator):
+    """
+    Excel report generator backed by xlsxwriter
+
+    Produces the same worksheets as ExcelReportGenerator. Styles are translated
+    once into cached xlsxwriter formats and rows are written in order in
+    constant-memory mode.
+    """
+
+    def __init__(self):
+        if xlsxwriter is None:
+            raise ImportError("XlsxWriterReportGenerator requires xlsxwriter")
+        # Only the shared styles are needed; the xlsxwriter workbook is
+        # created per report
+        self.wb = None
+        self._init_styles()
+        self._formats = {}
+
+    def create_comprehensive_report(
+        self,
+        gate_config: Dict,
+        analysis_results: Dict,
+        material_data: Dict,
+        output_path: str,
+        use_xlsxwriter: bool = True,
+    ) -> None:
+        """Create comprehensive Excel report with multiple worksheets"""
+        self.wb = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+        self._formats = {}
+
+        # Create worksheets
+        self._create_summary_sheet(gate_config, analysis_results)
+        self._create_calculations_sheet(analysis_results)
+        self._create_material_sheet(material_data)
+        self._create_loading_sheet(gate_config)
+        self._create_design_criteria_sheet()
+
+        # Save workbook
+        self.wb.close()
+
+    def _add_sheet(self, title: str):
+        """Create a worksheet"""
+        return self.wb.add_worksheet(title)
+
+    def _cell(
+        self, ws, value, font, fill, alignment, border, number_format
+    ) -> _XlsxCell:
+        """Pair a value with the cached xlsxwriter format for its style"""
+        # Styles are the generator's shared objects, so identity is a safe key
+        key = (id(font), id(fill), id(alignment), id(border), number_format)
+        cell_format = self._formats.get(key)
+        if cell_format is None:
+            properties = {}
+            if font is not None:
+                properties["bold"] = bool(font.b)
+                if font.sz:
+                    properties["font_size"] = font.sz
+                if font.color is not None and font.color.rgb:
+                    properties["font_color"] = "#" + font.color.rgb[-6:]
+            if fill is not None:
+                properties["pattern"] = 1
+                properties["bg_color"] = "#" + fill.fgColor.rgb[-6:]
+            if alignment is not None:
+                if alignment.horizontal:
+                    properties["align"] = alignment.horizontal
+                if alignment.vertical == "center":
+                    properties["valign"] = "vcenter"
+            if border is not None:
+                properties["border"] = 1
+            if number_format is not None:
+                properties["num_format"] = number_format
+            cell_format = self._formats[key] = self.wb.add_format(properties)
+        return _XlsxCell(value, cell_format)
+
+    def _write_sheet(self, ws, rows: List[List], title_span: str) -> None:
+        """Size the columns, write the rows and merge the title across title_span"""
+        for column, width in self._column_widths(rows[1:]).items():
+            ws.set_column(column - 1, column - 1, width)
+        # Constant-memory mode only accepts cells in row order
+        title = rows[0][0]
+        ws.merge_range(title_span, title.value, title.format)
+        for row_index, row in enumerate(rows[1:], start=1):
+            for column, cell in enumerate(row):
+                ws.write(row_index, column, cell.value, cell.format)
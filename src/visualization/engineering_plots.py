@@ -3,20 +3,59 @@ Advanced engineering visualization using matplotlib
 """
 
 from typing import Dict, List
+from functools import cache
 import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # Plots are only written to files
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.collections import PatchCollection
 from matplotlib.patches import Rectangle
 from matplotlib.gridspec import GridSpec
-from src.analysis.advanced_structural import BeamSection
+from src.analysis.advanced_structural import BeamSection, SectionArray
+
+
+# Summary box text for the structural analysis report
+_SUMMARY_TEMPLATE = """STRUCTURAL ANALYSIS SUMMARY
+
+Section: {name}
+Max Moment: {moment_kNm:.1f} kN⋅m
+Max Stress: {stress_MPa:.1f} MPa
+Allowable Stress: {allowable_MPa:.1f} MPa
+Stress Ratio: {stress_ratio:.2f}
+
+Max Deflection: {deflection_mm:.1f} mm
+Deflection Limit: {limit_mm:.1f} mm
+Deflection Ratio: {deflection_ratio:.2f}
+
+Safety Status: {status}"""
+
+
+@cache
+def _use_style(style: str) -> None:
+    """Apply a matplotlib style sheet once per process"""
+    plt.style.use(style)
 
 
 class EngineeringPlotter:
     """Create professional engineering plots and diagrams"""
 
     def __init__(self, style: str = "seaborn-v0_8-whitegrid"):
-        plt.style.use(style)
+        _use_style(style)
         self.fig_size = (12, 8)
-        self.dpi = 300
+        # Figures are drawn at screen resolution and rasterized at print
+        # resolution only when saved
+        self.render_dpi = 100
+        self.save_dpi = 300
+        # Annotation box styles shared by every plot
+        self._annot_bbox = dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7)
+        self._summary_bbox = dict(
+            boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8
+        )
+        # Report figure, cleared and redrawn for each report; constrained
+        # layout is solved during the save's single draw
+        self._fig = Figure(figsize=(16, 12), dpi=self.render_dpi, layout="constrained")
 
     def create_structural_analysis_report(
         self,
@@ -27,21 +66,36 @@ class EngineeringPlotter:
     ) -> None:
         """Create comprehensive structural analysis report with plots"""
 
+        # Diagram series in plot units, converted once for all panels
+        x_m = analysis_results["positions_mm"] / 1000  # Convert to meters
+        moments_kNm = analysis_results["moments_Nmm"] / 1e6  # Convert to kN⋅m
+        shears_kN = analysis_results["shears_N"] / 1000
+        deflections_mm = analysis_results["deflections_mm"]
+
         # Create multi-panel figure
-        fig = plt.figure(figsize=(16, 12), dpi=self.dpi)
-        gs = GridSpec(3, 2, figure=fig, hspace=0.3, wspace=0.3)
+        fig = self._fig
+        fig.clear()
+        gs = GridSpec(3, 2, figure=fig)
 
         # Plot 1: Moment Diagram
         ax1 = fig.add_subplot(gs[0, :])
-        self._plot_moment_diagram(ax1, analysis_results)
+        self._plot_moment_diagram(
+            ax1, x_m, moments_kNm, np.argmax(np.abs(moments_kNm))
+        )
 
         # Plot 2: Shear Diagram
         ax2 = fig.add_subplot(gs[1, 0])
-        self._plot_shear_diagram(ax2, analysis_results)
+        self._plot_shear_diagram(ax2, x_m, shears_kN, np.argmax(np.abs(shears_kN)))
 
         # Plot 3: Deflection Diagram
         ax3 = fig.add_subplot(gs[1, 1])
-        self._plot_deflection_diagram(ax3, analysis_results)
+        self._plot_deflection_diagram(
+            ax3,
+            x_m,
+            deflections_mm,
+            np.argmax(np.abs(deflections_mm)),
+            analysis_results["deflection_limit_mm"],
+        )
 
         # Plot 4: Gate Elevation View
         ax4 = fig.add_subplot(gs[2, :])
@@ -63,30 +117,26 @@ class EngineeringPlotter:
             transform=fig.transFigure,
             fontsize=10,
             verticalalignment="top",
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8),
+            bbox=self._summary_bbox,
         )
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=self.dpi, bbox_inches="tight")
-        plt.close()
-
-    def _plot_moment_diagram(self, ax, results: Dict) -> None:
-        """Plot bending moment diagram"""
-        x_m = results["positions_mm"] / 1000  # Convert to meters
-        moments_kNm = results["moments_Nmm"] / 1e6  # Convert to kN⋅m
+        fig.savefig(output_path, dpi=self.save_dpi)
 
+    def _plot_moment_diagram(
+        self, ax, x_m: np.ndarray, moments_kNm: np.ndarray, max_idx: int
+    ) -> None:
+        """Plot bending moment diagram (max_idx marks the peak magnitude)"""
         ax.plot(x_m, moments_kNm, "b-", linewidth=2, label="Bending Moment")
         ax.fill_between(x_m, 0, moments_kNm, alpha=0.3, color="blue")
 
         # Mark maximum moment
-        max_idx = np.argmax(np.abs(moments_kNm))
         ax.plot(x_m[max_idx], moments_kNm[max_idx], "ro", markersize=8)
         ax.annotate(
             f"Max: {moments_kNm[max_idx]:.1f} kN⋅m",
             xy=(x_m[max_idx], moments_kNm[max_idx]),
             xytext=(10, 10),
             textcoords="offset points",
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
+            bbox=self._annot_bbox,
         )
 
         ax.set_xlabel("Position (m)")
@@ -95,23 +145,21 @@ class EngineeringPlotter:
         ax.grid(True, alpha=0.3)
         ax.legend()
 
-    def _plot_shear_diagram(self, ax, results: Dict) -> None:
-        """Plot shear force diagram"""
-        x_m = results["positions_mm"] / 1000
-        shears_kN = results["shears_N"] / 1000
-
+    def _plot_shear_diagram(
+        self, ax, x_m: np.ndarray, shears_kN: np.ndarray, max_idx: int
+    ) -> None:
+        """Plot shear force diagram (max_idx marks the peak magnitude)"""
         ax.plot(x_m, shears_kN, "g-", linewidth=2, label="Shear Force")
         ax.fill_between(x_m, 0, shears_kN, alpha=0.3, color="green")
 
         # Mark maximum shear
-        max_idx = np.argmax(np.abs(shears_kN))
         ax.plot(x_m[max_idx], shears_kN[max_idx], "ro", markersize=8)
         ax.annotate(
             f"Max: {shears_kN[max_idx]:.1f} kN",
             xy=(x_m[max_idx], shears_kN[max_idx]),
             xytext=(10, 10),
             textcoords="offset points",
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
+            bbox=self._annot_bbox,
         )
 
         ax.set_xlabel("Position (m)")
@@ -120,27 +168,29 @@ class EngineeringPlotter:
         ax.grid(True, alpha=0.3)
         ax.legend()
 
-    def _plot_deflection_diagram(self, ax, results: Dict) -> None:
-        """Plot deflection diagram"""
-        x_m = results["positions_mm"] / 1000
-        deflections_mm = results["deflections_mm"]
-
+    def _plot_deflection_diagram(
+        self,
+        ax,
+        x_m: np.ndarray,
+        deflections_mm: np.ndarray,
+        max_idx: int,
+        limit_mm: float,
+    ) -> None:
+        """Plot deflection diagram (max_idx marks the peak magnitude)"""
         ax.plot(x_m, deflections_mm, "r-", linewidth=2, label="Deflection")
         ax.fill_between(x_m, 0, deflections_mm, alpha=0.3, color="red")
 
         # Mark maximum deflection
-        max_idx = np.argmax(np.abs(deflections_mm))
         ax.plot(x_m[max_idx], deflections_mm[max_idx], "ro", markersize=8)
         ax.annotate(
             f"Max: {deflections_mm[max_idx]:.1f} mm",
             xy=(x_m[max_idx], deflections_mm[max_idx]),
             xytext=(10, 10),
             textcoords="offset points",
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
+            bbox=self._annot_bbox,
         )
 
         # Add deflection limit line
-        limit_mm = results["deflection_limit_mm"]
         ax.axhline(
             y=-limit_mm,
             color="orange",
@@ -162,60 +212,50 @@ class EngineeringPlotter:
         width_m = gate_width_mm / 1000
         height_m = 2.4  # Standard gate height
 
+        # Limits are set explicitly below, so skip autoscaling and data-limit
+        # updates while the frame and members are added
+        ax.set_autoscale_on(False)
+
         # Draw gate frame
-        gate_rect = Rectangle(
-            (0, 0),
-            width_m,
-            height_m,
-            linewidth=3,
-            edgecolor="black",
-            facecolor="lightgray",
-            alpha=0.5,
+        ax.add_collection(
+            PatchCollection(
+                [Rectangle((0, 0), width_m, height_m)],
+                linewidth=3,
+                edgecolor="black",
+                facecolor="lightgray",
+                alpha=0.5,
+            ),
+            autolim=False,
         )
-        ax.add_patch(gate_rect)
 
         # Draw main structural members
         member_width = section.width_mm / 1000
         member_height = section.depth_mm / 1000
-
-        # Top rail
-        top_rail = Rectangle(
-            (0, height_m - member_height),
-            width_m,
-            member_height,
-            linewidth=2,
-            edgecolor="blue",
-            facecolor="blue",
-            alpha=0.7,
-        )
-        ax.add_patch(top_rail)
-
-        # Bottom rail
-        bottom_rail = Rectangle(
-            (0, 0),
-            width_m,
-            member_height,
-            linewidth=2,
-            edgecolor="blue",
-            facecolor="blue",
-            alpha=0.7,
-        )
-        ax.add_patch(bottom_rail)
-
-        # Vertical members
         n_verticals = int(width_m / 1.5) + 1  # Vertical every 1.5m
-        for i in range(n_verticals):
-            x_pos = i * width_m / (n_verticals - 1)
-            vertical = Rectangle(
-                (x_pos - member_width / 2, 0),
+
+        # Top rail, bottom rail and vertical members, drawn as one collection
+        members = [
+            Rectangle((0, height_m - member_height), width_m, member_height),
+            Rectangle((0, 0), width_m, member_height),
+        ]
+        members.extend(
+            Rectangle(
+                (i * width_m / (n_verticals - 1) - member_width / 2, 0),
                 member_width,
                 height_m,
+            )
+            for i in range(n_verticals)
+        )
+        ax.add_collection(
+            PatchCollection(
+                members,
                 linewidth=2,
                 edgecolor="blue",
                 facecolor="blue",
                 alpha=0.7,
-            )
-            ax.add_patch(vertical)
+            ),
+            autolim=False,
+        )
 
         # Add dimensions
         ax.annotate(
@@ -263,37 +303,46 @@ class EngineeringPlotter:
 
     def _create_summary_text(self, results: Dict, section: BeamSection) -> str:
         """Create summary text for the analysis"""
-        summary = f"""STRUCTURAL ANALYSIS SUMMARY
-        
-Section: {section.name}
-Max Moment: {results["max_moment_Nmm"] / 1e6:.1f} kN⋅m
-Max Stress: {results["max_stress_Pa"] / 1e6:.1f} MPa
-Allowable Stress: {results["allowable_stress_Pa"] / 1e6:.1f} MPa
-Stress Ratio: {results["stress_ratio"]:.2f}
-
-Max Deflection: {results["max_deflection_mm"]:.1f} mm
-Deflection Limit: {results["deflection_limit_mm"]:.1f} mm
-Deflection Ratio: {results["deflection_ratio"]:.2f}
-
-Safety Status: {"ADEQUATE" if results["safety_adequate"] else "INADEQUATE"}"""
-
-        return summary
+        return _SUMMARY_TEMPLATE.format_map(
+            {
+                "name": section.name,
+                "moment_kNm": results["max_moment_Nmm"] / 1e6,
+                "stress_MPa": results["max_stress_Pa"] / 1e6,
+                "allowable_MPa": results["allowable_stress_Pa"] / 1e6,
+                "stress_ratio": results["stress_ratio"],
+                "deflection_mm": results["max_deflection_mm"],
+                "limit_mm": results["deflection_limit_mm"],
+                "deflection_ratio": results["deflection_ratio"],
+                "status": "ADEQUATE" if results["safety_adequate"] else "INADEQUATE",
+            }
+        )
 
     def create_material_optimization_plot(
         self,
-        sections: List[BeamSection],
+        sections: SectionArray,
         analysis_results: List[Dict],
         output_path: str,
     ) -> None:
         """Create material optimization comparison plot"""
 
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(
+            2, 2, figsize=(15, 10), layout="constrained"
+        )
 
-        section_names = [s.name for s in sections]
-        weights = [s.area_mm2 * 6000 / 1000 for s in sections]  # kg for 6m beam
-        stress_ratios = [r["stress_ratio"] for r in analysis_results]
-        deflection_ratios = [r["deflection_ratio"] for r in analysis_results]
-        costs = [w * 0.8 for w in weights]  # Estimated cost in USD/kg
+        section_names = sections.name.tolist()
+        weights = sections.area_mm2 * 6000 / 1000  # kg for 6m beam
+        n_sections = len(analysis_results)
+        stress_ratios = np.fromiter(
+            (r["stress_ratio"] for r in analysis_results),
+            dtype=np.float64,
+            count=n_sections,
+        )
+        deflection_ratios = np.fromiter(
+            (r["deflection_ratio"] for r in analysis_results),
+            dtype=np.float64,
+            count=n_sections,
+        )
+        costs = weights * 0.8  # Estimated cost in USD/kg
 
         # Weight comparison
         bars1 = ax1.bar(section_names, weights, color="skyblue", edgecolor="navy")
@@ -302,15 +351,7 @@ Safety Status: {"ADEQUATE" if results["safety_adequate"] else "INADEQUATE"}"""
         ax1.tick_params(axis="x", rotation=45)
 
         # Add value labels on bars
-        for bar, weight in zip(bars1, weights):
-            height = bar.get_height()
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"{weight:.0f} kg",
-                ha="center",
-                va="bottom",
-            )
+        ax1.bar_label(bars1, labels=[f"{weight:.0f} kg" for weight in weights], padding=3)
 
         # Stress ratio comparison
         bars2 = ax2.bar(
@@ -338,6 +379,5 @@ Safety Status: {"ADEQUATE" if results["safety_adequate"] else "INADEQUATE"}"""
         ax4.set_title("Material Cost Comparison")
         ax4.tick_params(axis="x", rotation=45)
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches="tight")
-        plt.close()
+        fig.savefig(output_path, dpi=self.save_dpi)
+        plt.close(fig)
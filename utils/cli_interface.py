@@ -2,49 +2,74 @@
 Command line interface for gate design tool
 """
 
+import re
+import sys
+
 from designs.gate_designer import DesignRequirements
+from utils.engineering_constants import M_TO_MM
+
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:  # prompt_toolkit is optional (the "cli" extra)
+    PromptSession = None
+
+# Accepted numeric input; values are only converted once they match
+_FLOAT_RE = re.compile(r"[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?")
+_INT_RE = re.compile(r"[-+]?\d+")
 
 
 class CLIInterface:
     """Command line interface for user input"""
     
+    STEEL_GRADES = ('A36', 'A572_50', 'A992')
+    INFILL_TYPES = ('chain_link', 'expanded_metal', 'solid_plate', 'custom')
+    
+    # Menus and display labels, formatted once at import
+    _INFILL_LABELS = {infill: infill.replace('_', ' ').title() for infill in INFILL_TYPES}
+    _STEEL_MENU = "\nAvailable steel grades:\n" + "\n".join(
+        f"{i}. {grade}" for i, grade in enumerate(STEEL_GRADES, 1)
+    ) + "\n"
+    _INFILL_MENU = "\nAvailable infill types:\n" + "\n".join(
+        f"{i}. {label}" for i, label in enumerate(_INFILL_LABELS.values(), 1)
+    ) + "\n"
+    
     def __init__(self):
         self.units = "metric"  # Default to metric units
+        
+        # One prompt session for all questions; plain input() when
+        # prompt_toolkit is missing or input is piped
+        if PromptSession is not None and sys.stdin.isatty() and sys.stdout.isatty():
+            self._prompt = PromptSession().prompt
+        else:
+            self._prompt = input
     
     def get_design_requirements(self) -> DesignRequirements:
         """Get design requirements from user input"""
         
-        print("Enter gate design requirements:")
-        print("=" * 40)
+        sys.stdout.write("Enter gate design requirements:\n" + "=" * 40 + "\n")
         
         # Get basic dimensions
         width_m = self._get_float_input("Gate width (m)", default=6.0, min_val=3.0, max_val=20.0)
         height_m = self._get_float_input("Gate height (m)", default=2.4, min_val=1.5, max_val=5.0)
         
         # Convert to mm
-        width_mm = width_m * 1000
-        height_mm = height_m * 1000
+        width_mm = width_m * M_TO_MM
+        height_mm = height_m * M_TO_MM
         
         # Get design parameters
         wind_speed_ms = self._get_float_input("Design wind speed (m/s)", default=33.5, min_val=20.0, max_val=50.0)
         
         # Get material selection
-        steel_grades = ['A36', 'A572_50', 'A992']
-        print("\nAvailable steel grades:")
-        for i, grade in enumerate(steel_grades, 1):
-            print(f"{i}. {grade}")
+        sys.stdout.write(self._STEEL_MENU)
         
-        grade_choice = self._get_int_input("Select steel grade", default=2, min_val=1, max_val=len(steel_grades))
-        steel_grade = steel_grades[grade_choice - 1]
+        grade_choice = self._get_int_input("Select steel grade", default=2, min_val=1, max_val=len(self.STEEL_GRADES))
+        steel_grade = self.STEEL_GRADES[grade_choice - 1]
         
         # Get infill type
-        infill_types = ['chain_link', 'expanded_metal', 'solid_plate', 'custom']
-        print("\nAvailable infill types:")
-        for i, infill in enumerate(infill_types, 1):
-            print(f"{i}. {infill.replace('_', ' ').title()}")
+        sys.stdout.write(self._INFILL_MENU)
         
-        infill_choice = self._get_int_input("Select infill type", default=1, min_val=1, max_val=len(infill_types))
-        infill_type = infill_types[infill_choice - 1]
+        infill_choice = self._get_int_input("Select infill type", default=1, min_val=1, max_val=len(self.INFILL_TYPES))
+        infill_type = self.INFILL_TYPES[infill_choice - 1]
         
         # Create requirements object
         requirements = DesignRequirements(
@@ -55,17 +80,20 @@ class CLIInterface:
             infill_type=infill_type
         )
         
-        # Display summary
-        print("\n" + "=" * 40)
-        print("DESIGN REQUIREMENTS SUMMARY")
-        print("=" * 40)
-        print(f"Gate Size: {width_m:.1f}m x {height_m:.1f}m")
-        print(f"Steel Grade: {steel_grade}")
-        print(f"Infill Type: {infill_type.replace('_', ' ').title()}")
-        print(f"Wind Speed: {wind_speed_ms:.1f} m/s")
-        print()
-        
-        confirm = input("Proceed with design? (y/n): ").lower().strip()
+        # Display summary in one write
+        lines = [
+            "\n" + "=" * 40,
+            "DESIGN REQUIREMENTS SUMMARY",
+            "=" * 40,
+            f"Gate Size: {width_m:.1f}m x {height_m:.1f}m",
+            f"Steel Grade: {steel_grade}",
+            f"Infill Type: {self._INFILL_LABELS[infill_type]}",
+            f"Wind Speed: {wind_speed_ms:.1f} m/s",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        confirm = self._prompt("Proceed with design? (y/n): ").lower().strip()
         if confirm != 'y':
             print("Design cancelled.")
             exit()
@@ -74,66 +102,75 @@ class CLIInterface:
     
     def _get_float_input(self, prompt: str, default: float, min_val: float | None = None, max_val: float | None = None) -> float:
         """Get float input with validation"""
+        prompt_str = f"{prompt} [{default}]: "
         while True:
-            try:
-                user_input = input(f"{prompt} [{default}]: ").strip()
-                if not user_input:
-                    value = default
-                else:
-                    value = float(user_input)
-                
-                if min_val is not None and value < min_val:
-                    print(f"Value must be >= {min_val}")
-                    continue
-                
-                if max_val is not None and value > max_val:
-                    print(f"Value must be <= {max_val}")
-                    continue
-                
-                return value
-                
-            except ValueError:
+            user_input = self._prompt(prompt_str).strip()
+            if not user_input:
+                # Defaults are valid by construction
+                return default
+            
+            if not _FLOAT_RE.fullmatch(user_input):
                 print("Please enter a valid number.")
+                continue
+            
+            value = float(user_input)
+            
+            if min_val is not None and value < min_val:
+                print(f"Value must be >= {min_val}")
+                continue
+            
+            if max_val is not None and value > max_val:
+                print(f"Value must be <= {max_val}")
+                continue
+            
+            return value
     
     def _get_int_input(self, prompt: str, default: int, min_val: int | None = None, max_val: int | None = None) -> int:
         """Get integer input with validation"""
+        prompt_str = f"{prompt} [{default}]: "
         while True:
-            try:
-                user_input = input(f"{prompt} [{default}]: ").strip()
-                if not user_input:
-                    value = default
-                else:
-                    value = int(user_input)
-                
-                if min_val is not None and value < min_val:
-                    print(f"Value must be >= {min_val}")
-                    continue
-                
-                if max_val is not None and value > max_val:
-                    print(f"Value must be <= {max_val}")
-                    continue
-                
-                return value
-                
-            except ValueError:
+            user_input = self._prompt(prompt_str).strip()
+            if not user_input:
+                # Defaults are valid by construction
+                return default
+            
+            if not _INT_RE.fullmatch(user_input):
                 print("Please enter a valid integer.")
+                continue
+            
+            value = int(user_input)
+            
+            if min_val is not None and value < min_val:
+                print(f"Value must be >= {min_val}")
+                continue
+            
+            if max_val is not None and value > max_val:
+                print(f"Value must be <= {max_val}")
+                continue
+            
+            return value
     
     def display_results(self, design):
         """Display design results"""
-        print("\n" + "=" * 50)
-        print("DESIGN RESULTS")
-        print("=" * 50)
-        
-        print(f"Gate Weight: {design.structural_results['gate_weight_kg']:.1f} kg")
-        print(f"Counterweight: {design.structural_results['counterweight_kg']:.1f} kg")
-        print(f"Maximum Stress: {design.structural_results['beam_stress_MPa']:.1f} MPa")
-        print(f"Deflection: {design.structural_results['deflection_mm']:.1f} mm")
+        results = design.structural_results
+        lines = [
+            "\n" + "=" * 50,
+            "DESIGN RESULTS",
+            "=" * 50,
+            f"Gate Weight: {results['gate_weight_kg']:.1f} kg",
+            f"Counterweight: {results['counterweight_kg']:.1f} kg",
+            f"Maximum Stress: {results['beam_stress_MPa']:.1f} MPa",
+            f"Deflection: {results['deflection_mm']:.1f} mm",
+        ]
         
         if design.is_adequate:
-            print("\n✓ Design is ADEQUATE")
+            lines.append("\n✓ Design is ADEQUATE")
         else:
-            print("\n✗ Design NEEDS REVISION")
-            for note in design.design_notes:
-                print(f"  - {note}")
+            lines.append("\n✗ Design NEEDS REVISION")
+            lines.extend(f"  - {note}" for note in design.design_notes)
+        
+        lines.append(f"\nOutput files saved to: {design.output_path}")
         
-        print(f"\nOutput files saved to: {design.output_path}")
+        # One write and flush for the whole block
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
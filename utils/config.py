@@ -2,55 +2,137 @@
 Configuration management for gate design tool
 """
 
-import json
+import os
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
+from utils.serialization import read_json, write_json
 
-def load_config() -> Dict[str, Any]:
-    """Load configuration from file or create default"""
-    
-    config_file = Path("config.json")
-    
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            return json.load(f)
+# Configuration file, overridable through the GATE_CONFIG environment variable
+_CONFIG_PATH = Path(os.environ.get("GATE_CONFIG", "config.json"))
+
+
+@dataclass(frozen=True, slots=True)
+class SafetyFactors:
+    """Design safety factors"""
+    structural: float = 2.5
+    foundation: float = 3.0
+    fatigue: float = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class DefaultMaterials:
+    """Materials used when the user accepts the defaults"""
+    steel_grade: str = "A572_50"
+    infill_type: str = "chain_link"
+
+
+@dataclass(frozen=True, slots=True)
+class DesignParameters:
+    """Site and loading parameters"""
+    wind_speed_ms: float = 33.5
+    seismic_zone: str = "low"
+    exposure_category: str = "C"
+
+
+@dataclass(frozen=True, slots=True)
+class OutputSettings:
+    """Which outputs to generate"""
+    generate_drawings: bool = True
+    generate_calculations: bool = True
+    generate_specifications: bool = True
+    cache_designs: bool = False  # Opt-in; see utils.disk_cache
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Gate designer configuration, parsed once from config.json"""
+    units: str = "metric"
+    safety_factors: SafetyFactors = field(default_factory=SafetyFactors)
+    default_materials: DefaultMaterials = field(default_factory=DefaultMaterials)
+    design_parameters: DesignParameters = field(default_factory=DesignParameters)
+    output_settings: OutputSettings = field(default_factory=OutputSettings)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Config":
+        """
+        Build a configuration from its JSON form
+
+        Missing keys take their defaults and unknown keys are ignored, so
+        older or hand-edited config files still load.
+        """
+        return cls(
+            units=data.get("units", "metric"),
+            safety_factors=_section(SafetyFactors, data.get("safety_factors")),
+            default_materials=_section(DefaultMaterials, data.get("default_materials")),
+            design_parameters=_section(DesignParameters, data.get("design_parameters")),
+            output_settings=_section(OutputSettings, data.get("output_settings")),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form of the configuration"""
+        return asdict(self)
+
+
+def _section(section_cls, data: Dict[str, Any] | None):
+    """Build one configuration section from the known keys of data"""
+    if not data:
+        return section_cls()
+    return section_cls(**{f.name: data[f.name] for f in fields(section_cls) if f.name in data})
+
+
+# Parsed configurations keyed by (absolute path, modification time in ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], Config] = {}
+
+
+def _remember_config(config_file: Path, config: Config) -> None:
+    """Cache a configuration as the current contents of config_file"""
+    path = str(config_file.absolute())
+    for key in [key for key in _CONFIG_CACHE if key[0] == path]:
+        del _CONFIG_CACHE[key]
+    _CONFIG_CACHE[(path, config_file.stat().st_mtime_ns)] = config
+
+
+def _invalidate_config_cache() -> None:
+    """Forget all cached configurations"""
+    _CONFIG_CACHE.clear()
+
+
+def load_config() -> Config:
+    """
+    Load configuration from file or create default
+
+    The parsed file is cached until its modification time changes. The
+    configuration is immutable, so the cached object is shared by callers.
+    """
+
+    config_file = _CONFIG_PATH
+
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+
+    if mtime_ns is not None:
+        config = _CONFIG_CACHE.get((str(config_file.absolute()), mtime_ns))
+        if config is None:
+            config = Config.from_dict(read_json(config_file))
+            _remember_config(config_file, config)
+        return config
     else:
-        # Create default configuration
-        default_config = {
-            "units": "metric",
-            "safety_factors": {
-                "structural": 2.5,
-                "foundation": 3.0,
-                "fatigue": 2.0
-            },
-            "default_materials": {
-                "steel_grade": "A572_50",
-                "infill_type": "chain_link"
-            },
-            "design_parameters": {
-                "wind_speed_ms": 33.5,
-                "seismic_zone": "low",
-                "exposure_category": "C"
-            },
-            "output_settings": {
-                "generate_drawings": True,
-                "generate_calculations": True,
-                "generate_specifications": True
-            }
-        }
-        
-        # Save default configuration
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=2)
-        
+        # Create and save default configuration
+        default_config = Config()
+        save_config(default_config)
+
         return default_config
 
 
-def save_config(config: Dict[str, Any]):
+def save_config(config: Config):
     """Save configuration to file"""
-    
-    config_file = Path("config.json")
-    
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+
+    config_file = _CONFIG_PATH
+
+    write_json(config_file, config.to_dict())
+
+    _remember_config(config_file, config)
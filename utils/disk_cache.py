@@ -0,0 +1,69 @@
+"""
+Persistent filesystem memoization for design computations
+"""
+
+import functools
+import hashlib
+import json
+import pickle
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable
+
+
+def cache_key(version: int, dataclass_obj: Any) -> str:
+    """
+    Stable hash of a dataclass instance for use as a cache file name
+
+    Args:
+        version: Cache format version, mixed into the key
+        dataclass_obj: Dataclass instance with JSON-compatible fields
+
+    Returns:
+        Hex SHA1 digest
+    """
+    payload = json.dumps([version, asdict(dataclass_obj)], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def disk_cached(cache_dir: Path, version: int) -> Callable:
+    """
+    Memoize a method taking one dataclass argument as pickles on disk
+
+    Results are stored as <cache_dir>/<key>.pkl, keyed on the argument's
+    fields and the cache version; bump the version whenever the computation
+    changes so stale results are ignored. Caching is opt-in: it only
+    happens when the instance has use_disk_cache set to True. Entries that
+    fail to load for any reason are recomputed and overwritten.
+
+    Args:
+        cache_dir: Directory holding the cached results
+        version: Cache format version
+
+    Returns:
+        Method decorator
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, arg):
+            if not getattr(self, "use_disk_cache", False):
+                return method(self, arg)
+
+            cache_file = cache_dir / f"{cache_key(version, arg)}.pkl"
+            if cache_file.exists():
+                try:
+                    return pickle.loads(cache_file.read_bytes())
+                except Exception:
+                    pass  # Unreadable or incompatible entry - recompute and overwrite it
+
+            result = method(self, arg)
+
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(pickle.dumps(result))
+
+            return result
+
+        return wrapper
+
+    return decorator
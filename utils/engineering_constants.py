@@ -2,28 +2,85 @@
 Engineering constants and unit conversions
 """
 
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class EngineeringConstants:
+    """
+    Engineering constants as attributes of one immutable object
+
+    Hot loops can bind CONST to a local once and read constants as slot
+    attributes instead of module globals.
+    """
+
+    # Physical constants
+    GRAVITY_MS2: float = 9.81  # Acceleration due to gravity (m/s²)
+    ATMOSPHERIC_PRESSURE_PA: float = 101325  # Standard atmospheric pressure (Pa)
+
+    # Unit conversions
+    MM_TO_M: float = 1e-3
+    M_TO_MM: float = 1e3
+    KG_TO_N: float = GRAVITY_MS2
+    N_TO_KG: float = 1.0 / GRAVITY_MS2
+    PA_TO_MPA: float = 1e-6
+    MPA_TO_PA: float = 1e6
+    PA_TO_GPA: float = 1e-9
+
+    # Material densities (kg/m³)
+    STEEL_DENSITY_KG_M3: float = 7850
+    CONCRETE_DENSITY_KG_M3: float = 2400
+    ALUMINUM_DENSITY_KG_M3: float = 2700
+
+    # Material unit weights (N/m³)
+    STEEL_UNIT_WEIGHT_N_M3: float = STEEL_DENSITY_KG_M3 * GRAVITY_MS2
+    CONCRETE_UNIT_WEIGHT_N_M3: float = CONCRETE_DENSITY_KG_M3 * GRAVITY_MS2
+
+    # Common load factors
+    DEAD_LOAD_FACTOR: float = 1.2
+    LIVE_LOAD_FACTOR: float = 1.6
+    WIND_LOAD_FACTOR: float = 1.0
+    SEISMIC_LOAD_FACTOR: float = 1.0
+
+    # Safety factors
+    STRUCTURAL_SAFETY_FACTOR: float = 2.5
+    FOUNDATION_SAFETY_FACTOR: float = 3.0
+    FATIGUE_SAFETY_FACTOR: float = 2.0
+
+
+CONST = EngineeringConstants()
+
+# Module-level names, kept for existing imports
+
 # Physical constants
-GRAVITY_MS2 = 9.81  # Acceleration due to gravity (m/s²)
-ATMOSPHERIC_PRESSURE_PA = 101325  # Standard atmospheric pressure (Pa)
+GRAVITY_MS2 = CONST.GRAVITY_MS2
+ATMOSPHERIC_PRESSURE_PA = CONST.ATMOSPHERIC_PRESSURE_PA
 
 # Unit conversions
-MM_TO_M = 1e-3
-M_TO_MM = 1e3
-KG_TO_N = GRAVITY_MS2
-N_TO_KG = 1.0 / GRAVITY_MS2
+MM_TO_M = CONST.MM_TO_M
+M_TO_MM = CONST.M_TO_MM
+KG_TO_N = CONST.KG_TO_N
+N_TO_KG = CONST.N_TO_KG
+PA_TO_MPA = CONST.PA_TO_MPA
+MPA_TO_PA = CONST.MPA_TO_PA
+PA_TO_GPA = CONST.PA_TO_GPA
 
 # Material densities (kg/m³)
-STEEL_DENSITY_KG_M3 = 7850
-CONCRETE_DENSITY_KG_M3 = 2400
-ALUMINUM_DENSITY_KG_M3 = 2700
+STEEL_DENSITY_KG_M3 = CONST.STEEL_DENSITY_KG_M3
+CONCRETE_DENSITY_KG_M3 = CONST.CONCRETE_DENSITY_KG_M3
+ALUMINUM_DENSITY_KG_M3 = CONST.ALUMINUM_DENSITY_KG_M3
+
+# Material unit weights (N/m³)
+STEEL_UNIT_WEIGHT_N_M3 = CONST.STEEL_UNIT_WEIGHT_N_M3
+CONCRETE_UNIT_WEIGHT_N_M3 = CONST.CONCRETE_UNIT_WEIGHT_N_M3
 
 # Common load factors
-DEAD_LOAD_FACTOR = 1.2
-LIVE_LOAD_FACTOR = 1.6
-WIND_LOAD_FACTOR = 1.0
-SEISMIC_LOAD_FACTOR = 1.0
+DEAD_LOAD_FACTOR = CONST.DEAD_LOAD_FACTOR
+LIVE_LOAD_FACTOR = CONST.LIVE_LOAD_FACTOR
+WIND_LOAD_FACTOR = CONST.WIND_LOAD_FACTOR
+SEISMIC_LOAD_FACTOR = CONST.SEISMIC_LOAD_FACTOR
 
 # Safety factors
-STRUCTURAL_SAFETY_FACTOR = 2.5
-FOUNDATION_SAFETY_FACTOR = 3.0
-FATIGUE_SAFETY_FACTOR = 2.0
+STRUCTURAL_SAFETY_FACTOR = CONST.STRUCTURAL_SAFETY_FACTOR
+FOUNDATION_SAFETY_FACTOR = CONST.FOUNDATION_SAFETY_FACTOR
+FATIGUE_SAFETY_FACTOR = CONST.FATIGUE_SAFETY_FACTOR
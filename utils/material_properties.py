@@ -3,10 +3,13 @@ Material properties utility functions
 Maintains compatibility with existing code while using updated core materials
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from src.core.materials import get_material_properties_by_name, SteelProperties
-from typing import Dict, Any
+from typing import Any, Mapping
 
 
+@lru_cache(maxsize=None)
 def get_steel_properties(grade_name: str) -> SteelProperties:
     """
     Get steel properties by grade name
@@ -16,11 +19,16 @@ def get_steel_properties(grade_name: str) -> SteelProperties:
 
     Returns:
         SteelProperties object with all material properties
+
+    Note:
+        Results are memoized per grade name; steel grades form a small closed
+        set and the returned properties are shared, read-only data.
     """
     return get_material_properties_by_name(grade_name)
 
 
-def get_steel_properties_dict(grade_name: str) -> Dict[str, Any]:
+@lru_cache(maxsize=16)
+def get_steel_properties_dict(grade_name: str) -> Mapping[str, Any]:
     """
     Get steel properties as dictionary for backward compatibility
 
@@ -28,11 +36,12 @@ def get_steel_properties_dict(grade_name: str) -> Dict[str, Any]:
         grade_name: Steel grade name
 
     Returns:
-        Dictionary with material properties
+        Read-only mapping with material properties, built once per grade;
+        use dict(...) for a mutable copy
     """
     props = get_steel_properties(grade_name)
 
-    return {
+    return MappingProxyType({
         'grade': props.grade,
         'yield_strength_Pa': props.yield_strength_Pa,
         'ultimate_strength_Pa': props.ultimate_strength_Pa,
@@ -43,7 +52,7 @@ def get_steel_properties_dict(grade_name: str) -> Dict[str, Any]:
         'yield_strength_MPa': props.yield_strength_MPa,
         'ultimate_strength_MPa': props.ultimate_strength_MPa,
         'elastic_modulus_GPa': props.elastic_modulus_GPa
-    }
+    })
 
 
 # Common steel grades for quick reference
@@ -55,6 +64,9 @@ COMMON_GRADES = {
 }
 
 
-def list_available_grades() -> Dict[str, str]:
-    """Get list of available steel grades with descriptions"""
-    return COMMON_GRADES.copy()
+_COMMON_GRADES_VIEW = MappingProxyType(COMMON_GRADES)
+
+
+def list_available_grades() -> Mapping[str, str]:
+    """Get available steel grades with descriptions (read-only view)"""
+    return _COMMON_GRADES_VIEW
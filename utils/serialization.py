@@ -0,0 +1,85 @@
+"""
+JSON serialization helpers for design outputs
+Uses orjson when it is installed (the "json" extra) and otherwise the
+standard library, writing equivalent UTF-8 JSON either way
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _to_builtin(obj: Any) -> Any:
+    """
+    Convert an object for the standard library encoder the way orjson
+    serializes it: NumPy arrays and scalars become lists and numbers, and
+    NaN and infinities become None (null)
+    """
+    if isinstance(obj, dict):
+        return {key: _to_builtin(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_builtin(value) for value in obj]
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return _to_builtin(obj.tolist())
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """
+    Write an object to a JSON file with 2-space indentation
+
+    Args:
+        path: Output file path
+        obj: JSON-compatible object; NumPy arrays and scalars are supported
+    """
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        text = json.dumps(_to_builtin(obj), indent=2, ensure_ascii=False, allow_nan=False)
+        path.write_text(text, encoding="utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """
+    Read a JSON file in a single read
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Parsed JSON object
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_line(obj: Any) -> bytes:
+    """
+    Encode an object as one compact JSON Lines record
+
+    Args:
+        obj: JSON-compatible object; NumPy arrays and scalars are supported
+
+    Returns:
+        UTF-8 encoded JSON followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    text = json.dumps(
+        _to_builtin(obj), separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    )
+    return text.encode("utf-8") + b"\n"